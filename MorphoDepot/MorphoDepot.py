@@ -1,12 +1,13 @@
-from contextlib import contextmanager
 from typing import Annotated, Optional
+import concurrent.futures
 import csv
 import datetime
 import fnmatch
+import functools
 import git
 import glob
+import importlib.util
 import json
-import locale
 import logging
 import math
 import os
@@ -66,7 +67,9 @@ class EnableModuleMixin:
     """A superclass to check that everything is correct before enabling the module.  """
 
     def __init__(self):
-        pass
+        # set once the version, python and git checks pass; they do not change
+        # during a session unless the git or gh path is reconfigured
+        self.dependenciesAvailable = False
 
     def offerPythonInstallation(self):
         msg = "Extra python packages (idigbio and pygbif) are required."
@@ -83,6 +86,27 @@ class EnableModuleMixin:
         """Module is only enabled if all of the dependencies are available,
         possibly after the user has accepted installation and it worked as expected
         """
+        if not self.dependenciesAvailable:
+            if not self.checkDependencies():
+                return False
+            self.dependenciesAvailable = True
+
+        # check local directory
+        repoDirectory = self.logic.localRepositoryDirectory()
+        if not os.path.exists(repoDirectory):
+            msgBox = qt.QMessageBox()
+            msgBox.setWindowTitle("MorphoDepot Repository Directory")
+            msgBox.setText("The local directory must exist and be writable.")
+            informativeText = f"Could not create or access the directory:\n{repoDirectory}\n\nGo into the configure tab and set a valid local repository directory."
+            msgBox.setInformativeText(informativeText)
+            msgBox.setIcon(qt.QMessageBox.Warning)
+            msgBox.exec_()
+            return False
+
+        return True
+
+    def checkDependencies(self):
+        """Check the Slicer version and the python, git, and gh dependencies"""
         # check Slicer version
         if not self.logic.slicerVersionCheck():
             msg = "This version of Slicer is not supported. Use a newer Preview or a Release after 5.8."
@@ -110,18 +134,6 @@ class EnableModuleMixin:
                 qt.QDesktopServices.openUrl(qt.QUrl("https://github.com/MorphoCloud/SlicerMorphoDepot?tab=readme-ov-file#prerequisites-for-morphodepot"))
             return False
 
-        # check local directory
-        repoDirectory = self.logic.localRepositoryDirectory()
-        if not os.path.exists(repoDirectory):
-            msgBox = qt.QMessageBox()
-            msgBox.setWindowTitle("MorphoDepot Repository Directory")
-            msgBox.setText("The local directory must exist and be writable.")
-            informativeText = f"Could not create or access the directory:\n{repoDirectory}\n\nGo into the configure tab and set a valid local repository directory."
-            msgBox.setInformativeText(informativeText)
-            msgBox.setIcon(qt.QMessageBox.Warning)
-            msgBox.exec_()
-            return False
-
         return True
 
 
@@ -130,13 +142,20 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
     https://github.com/Slicer/Slicer/blob/main/Base/Python/slicer/ScriptedLoadableModule.py
     """
 
+    # names that can be used for github release assets
+    validGithubAsset = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9._-]*[a-zA-Z0-9])?$')
+
     def __init__(self, parent=None) -> None:
         """Called when the user opens the module the first time and the widget is initialized."""
         ScriptedLoadableModuleWidget.__init__(self, parent)
         VTKObservationMixin.__init__(self)  # needed for parameter node observation
+        EnableModuleMixin.__init__(self)
         self.logic = None
-        self.issuesByItem = {}
-        self.prsByItem = {}
+        # list contents, indexed by row of the corresponding list widget
+        self.issues = []
+        self.annotatePRs = []
+        self.reviewPRs = []
+        self.releaseRepos = []
         self.segmentNamesByID = {}
         self.hidePRDrafts = True
         self.searchResultsByItem = {}
@@ -148,11 +167,23 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
         self.includeReleaseUI = True
         self.includeAdminUI = False
 
+    # loader shared by the tab .ui files (see loadUI)
+    uiLoader = None
+
+    # progressMethod is also used unbound, so its throttling state is kept on the class
+    progressEventsInterval = 1. / 30
+    lastProgressEventsTime = 0.
+
     def progressMethod(self, message=None):
         message = message if message else self
         logging.info(message)
         slicer.util.showStatusMessage(message)
-        slicer.app.processEvents(qt.QEventLoop.ExcludeUserInputEvents)
+        # bursts of messages only repaint at a limited rate; the latest status
+        # message is shown on the next event loop pass in any case
+        now = time.monotonic()
+        if now - MorphoDepotWidget.lastProgressEventsTime >= MorphoDepotWidget.progressEventsInterval:
+            MorphoDepotWidget.lastProgressEventsTime = now
+            slicer.app.processEvents(qt.QEventLoop.ExcludeUserInputEvents)
 
     def setupLogic(self):
         self.logic = MorphoDepotLogic(progressMethod=self.progressMethod)
@@ -161,41 +192,30 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
         """Called when the user opens the module the first time and the widget is initialized."""
         ScriptedLoadableModuleWidget.setup(self)
 
-        # Load widget from .ui file (created by Qt Designer).
-        # Additional widgets can be instantiated manually and added to self.layout.
+        # Only the Configure tab and the tab restored from the settings are built here.
+        # The other tabs get an empty page and are loaded from their .ui files the first
+        # time they are shown (see ensureTabBuilt).
         self.tabWidget = qt.QTabWidget()
         self.layout.addWidget(self.tabWidget)
 
-        uiWidget = slicer.util.loadUI(os.path.normpath(self.resourcePath("UI/MorphoDepotConfigure.ui")))
-        uiWidget.setMRMLScene(slicer.mrmlScene)
-        self.configureTabIndex = self.tabWidget.addTab(uiWidget, "Configure")
-        self.configureUI = slicer.util.childWidgetVariables(uiWidget)
-
-        uiWidget = slicer.util.loadUI(os.path.normpath(self.resourcePath("UI/MorphoDepotSearch.ui")))
-        uiWidget.setMRMLScene(slicer.mrmlScene)
-        self.tabWidget.addTab(uiWidget, "Search")
-        self.searchUI = slicer.util.childWidgetVariables(uiWidget)
-
-        uiWidget = slicer.util.loadUI(os.path.normpath(self.resourcePath("UI/MorphoDepotAnnotate.ui")))
-        uiWidget.setMRMLScene(slicer.mrmlScene)
-        self.tabWidget.addTab(uiWidget, "Annotate")
-        self.annotateUI = slicer.util.childWidgetVariables(uiWidget)
-
-        uiWidget = slicer.util.loadUI(os.path.normpath(self.resourcePath("UI/MorphoDepotReview.ui")))
-        uiWidget.setMRMLScene(slicer.mrmlScene)
-        self.tabWidget.addTab(uiWidget, "Review")
-        self.reviewUI = slicer.util.childWidgetVariables(uiWidget)
-
-        uiWidget = slicer.util.loadUI(os.path.normpath(self.resourcePath("UI/MorphoDepotCreate.ui")))
-        uiWidget.setMRMLScene(slicer.mrmlScene)
-        self.tabWidget.addTab(uiWidget, "Create")
-        self.createUI = slicer.util.childWidgetVariables(uiWidget)
-
-        uiWidget = slicer.util.loadUI(os.path.normpath(self.resourcePath("UI/MorphoDepotRelease.ui")))
-        uiWidget.setMRMLScene(slicer.mrmlScene)
+        self.configureUI = None
+        self.searchUI = None
+        self.annotateUI = None
+        self.reviewUI = None
+        self.createUI = None
+        self.releaseUI = None
+        self.tabBuildersByIndex = {}
+        self.uiDirectory = os.path.normpath(self.resourcePath("UI"))
+        self.refreshButtonText = "Refresh Github"
+
+        self.configureTabIndex = self.addLazyTab("Configure", self.setupConfigureTab)
+        self.searchTabIndex = self.addLazyTab("Search", self.setupSearchTab)
+        self.annotateTabIndex = self.addLazyTab("Annotate", self.setupAnnotateTab)
+        self.reviewTabIndex = self.addLazyTab("Review", self.setupReviewTab)
+        self.createTabIndex = self.addLazyTab("Create", self.setupCreateTab)
+        self.releaseTabIndex = None
         if self.includeReleaseUI:
-            self.tabWidget.addTab(uiWidget, "Release")
-        self.releaseUI = slicer.util.childWidgetVariables(uiWidget)
+            self.releaseTabIndex = self.addLazyTab("Release", self.setupReleaseTab)
 
         self.adminTab = qt.QScrollArea()
         if self.includeAdminUI:
@@ -203,28 +223,72 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
         self.adminTabIndex = self.tabWidget.indexOf(self.adminTab)
         self.adminUI = {} # for future use
 
+        self.setupLogic()
+
+        self.ensureTabBuilt(self.configureTabIndex)
+
         # restore last tab index
         tabIndex = slicer.util.settingsValue("MorphoDepot/tabIndex", 0, converter=int)
         self.tabWidget.currentIndex = tabIndex
+        self.ensureTabBuilt(self.tabWidget.currentIndex)
 
+        self.tabWidget.currentChanged.connect(self.onCurrentTabChanged)
+
+        # set initial visibility of admin tab
+        self.onAdminModeChanged(self.configureUI.adminModeCheckBox.checkState())
+
+        self.updateRefreshButtonLabels()
+
+    def addLazyTab(self, label, builder):
+        """Add an empty page for a tab whose contents are created by builder on first display"""
+        page = qt.QWidget()
+        pageLayout = qt.QVBoxLayout(page)
+        pageLayout.setContentsMargins(0, 0, 0, 0)
+        tabIndex = self.tabWidget.addTab(page, label)
+        self.tabBuildersByIndex[tabIndex] = builder
+        return tabIndex
+
+    def ensureTabBuilt(self, tabIndex):
+        """Build the contents of the tab at tabIndex if that has not happened yet"""
+        builder = self.tabBuildersByIndex.pop(tabIndex, None)
+        if builder:
+            builder(self.tabWidget.widget(tabIndex))
+
+    def loadUI(self, path):
+        """Like slicer.util.loadUI, but a single QUiLoader is reused for all tabs"""
+        if MorphoDepotWidget.uiLoader is None:
+            MorphoDepotWidget.uiLoader = qt.QUiLoader()
+        MorphoDepotWidget.uiLoader.setWorkingDirectory(qt.QFileInfo(path).dir())
+        uiFile = qt.QFile(path)
+        uiFile.open(qt.QFile.ReadOnly)
+        uiWidget = MorphoDepotWidget.uiLoader.load(uiFile)
+        uiFile.close()
+        if uiWidget is None:
+            raise RuntimeError(f"Could not load UI file {path}")
+        return uiWidget
+
+    def loadTabUI(self, page, uiName):
+        """Load the named .ui file into a lazily created tab page"""
+        uiWidget = self.loadUI(os.path.join(self.uiDirectory, f"MorphoDepot{uiName}.ui"))
         # Set scene in MRML widgets. Make sure that in Qt designer the top-level qMRMLWidget's
         # "mrmlSceneChanged(vtkMRMLScene*)" signal in is connected to each MRML widget's.
         # "setMRMLScene(vtkMRMLScene*)" slot.
         uiWidget.setMRMLScene(slicer.mrmlScene)
+        page.layout().addWidget(uiWidget)
+        return slicer.util.childWidgetVariables(uiWidget)
 
-        self.setupLogic()
+    def setupConfigureTab(self, page):
+        self.configureUI = self.loadTabUI(page, "Configure")
 
-        # Configure
         # only allow picking directories (bitwise AND NOT file filter bit)
         self.configureUI.repoDirectory.filters = self.configureUI.repoDirectory.filters & ~self.configureUI.repoDirectory.Files
-        repoDir = os.path.normpath(self.logic.localRepositoryDirectory())
-        self.configureUI.repoDirectory.currentPath = repoDir
+        self.repoDirectoryPath = self.logic.localRepositoryDirectory()
+        self.configureUI.repoDirectory.currentPath = self.repoDirectoryPath
         self.configureUI.repoDirectory.toolTip = "Be sure to use a real local directory, not an iCloud or OneDrive online location"
-        self.configureUI.gitPath.currentPath = os.path.normpath(self.logic.gitExecutablePath) if self.logic.gitExecutablePath else ""
+        self.configureUI.gitPath.currentPath = self.logic.gitExecutablePath
         self.configureUI.gitPath.toolTip = "Restart Slicer after setting new path"
-        self.configureUI.ghPath.currentPath = os.path.normpath(self.logic.ghExecutablePath) if self.logic.ghExecutablePath else ""
+        self.configureUI.ghPath.currentPath = self.logic.ghExecutablePath
         self.configureUI.ghPath.toolTip = "Restart Slicer after setting new path"
-        self.annotateUI.forkManagementCollapsibleButton.enabled = False
 
         # Add reload button
         self.configureUI.reloadButton = qt.QPushButton("Apply Changes")
@@ -284,26 +348,38 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
             lambda: qt.QSettings().setValue("MorphoDepot/testingAnnotatorUser", self.configureUI.annotatorUser.text)
         )
 
-        # Create
+        # Connections
+        self.configureUI.repoDirectory.comboBox().connect("currentTextChanged(QString)", self.onRepoDirectoryChanged)
+        self.configureUI.gitPath.comboBox().connect("currentTextChanged(QString)", self.onGitPathChanged)
+        self.configureUI.adminModeCheckBox.stateChanged.connect(self.onAdminModeChanged)
+        self.configureUI.userNameLineEdit.textChanged.connect(self.onUserNameChanged)
+        self.configureUI.userEmailLineEdit.textChanged.connect(self.onUserEmailChanged)
+        self.configureUI.ghPath.comboBox().connect("currentTextChanged(QString)", self.onGhPathChanged)
+        self.configureUI.reloadButton.clicked.connect(self.onReload)
+
+    def setupCreateTab(self, page):
+        self.createUI = self.loadTabUI(page, "Create")
+
         self.createUI.inputSelector = slicer.qMRMLNodeComboBox()
         self.createUI.inputSelector.nodeTypes = ["vtkMRMLScalarVolumeNode"]
-        self.createUI.inputSelector.setMRMLScene(slicer.mrmlScene)
         self.createUI.inputSelector.showChildNodeTypes = False
         self.createUI.inputSelector.addEnabled = False
         self.createUI.inputSelector.removeEnabled = False
         self.createUI.inputSelector.noneDisplay = "Select a source volume (required)"
         self.createUI.inputSelector.toolTip = "Pick the source volume for the repository."
+        # set the scene last so the node list is populated once with the final filters
+        self.createUI.inputSelector.setMRMLScene(slicer.mrmlScene)
 
         self.createUI.colorSelector = slicer.qMRMLColorTableComboBox()
-        self.createUI.colorSelector.setMRMLScene(slicer.mrmlScene)
         self.createUI.colorSelector.noneDisplay = "Select a color table (required)"
+        self.createUI.colorSelector.setMRMLScene(slicer.mrmlScene)
 
         self.createUI.segmentationSelector = slicer.qMRMLNodeComboBox()
         self.createUI.segmentationSelector.nodeTypes = ["vtkMRMLSegmentationNode"]
-        self.createUI.segmentationSelector.setMRMLScene(slicer.mrmlScene)
         self.createUI.segmentationSelector.noneEnabled = True
         self.createUI.segmentationSelector.noneDisplay = "Select a baseline segmentation (optional)"
         self.createUI.segmentationSelector.toolTip = "Pick an baseline segmentation (optional)."
+        self.createUI.segmentationSelector.setMRMLScene(slicer.mrmlScene)
 
         formLayout = self.createUI.inputsCollapsibleButton.layout()
         formLayout.addRow("Source volume:", self.createUI.inputSelector)
@@ -343,31 +419,67 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
         self.createUI.verticalLayout.insertWidget(1, self.createUI.screenshotsCollapsibleButton)
 
         self.updateScreenshotCount()
-        # Annotate
+
+        # Connections
+        self.createUI.createRepository.clicked.connect(self.onCreateRepository)
+        self.createUI.openRepository.clicked.connect(self.onOpenRepository)
+        self.createUI.clearForm.clicked.connect(self.onClearForm)
+        self.createUI.fillFormForTestingButton.clicked.connect(self.onFillFormForTesting)
+        self.createUI.reviewScreenshotsButton.clicked.connect(self.onReviewScreenshots)
+        self.createUI.takeScreenshotButton.clicked.connect(self.onTakeScreenshot)
+
+    def setupAnnotateTab(self, page):
+        self.annotateUI = self.loadTabUI(page, "Annotate")
+
+        self.annotateUI.forkManagementCollapsibleButton.enabled = False
         self.annotateUI.commitButton.enabled = False
         self.annotateUI.reviewButton.enabled = False
+        self.annotateUI.refreshButton.text = self.refreshButtonText
+
+        # Connections
+        self.annotateUI.issueList.itemDoubleClicked.connect(self.onIssueDoubleClicked)
+        self.annotateUI.prList.itemSelectionChanged.connect(self.onPRSelectionChanged)
+        self.annotateUI.messageTitle.textChanged.connect(self.onCommitMessageChanged)
+        self.annotateUI.commitButton.clicked.connect(self.onCommit)
+        self.annotateUI.reviewButton.clicked.connect(self.onRequestReview)
+        self.annotateUI.refreshButton.connect("clicked(bool)", self.onRefresh)
+        self.annotateUI.openPRPageButton.clicked.connect(self.onOpenPRPageButtonClicked)
+
+    def setupReviewTab(self, page):
+        self.reviewUI = self.loadTabUI(page, "Review")
 
-        # Review
         self.reviewUI.prCollapsibleButton.enabled = False
+        self.reviewUI.hideDraftsCheckBox.checked = self.hidePRDrafts
+        self.reviewUI.refreshButton.text = self.refreshButtonText
+
+        # Connections
+        self.reviewUI.refreshButton.connect("clicked(bool)", self.onReviewRefresh)
+        self.reviewUI.prList.itemDoubleClicked.connect(self.onPRDoubleClicked)
+        self.reviewUI.hideDraftsCheckBox.stateChanged.connect(self.onHideDraftsChanged)
+        self.reviewUI.requestChangesButton.clicked.connect(self.onRequestChanges)
+        self.reviewUI.approveButton.clicked.connect(self.onApprove)
+
+    def setupReleaseTab(self, page):
+        self.releaseUI = self.loadTabUI(page, "Release")
 
-        # Release
         self.releaseUI.releasesCollapsibleButton.enabled = False
+        self.releaseUI.refreshButton.text = self.refreshButtonText
 
         # New-release inputs: required baseline segmentation and color table go into the form
         # layout next to the existing source-volume row. Screenshot widgets sit below in the
         # vertical layout, between the form and the release-comments block.
         self.releaseUI.newBaselineSelector = slicer.qMRMLNodeComboBox()
         self.releaseUI.newBaselineSelector.nodeTypes = ["vtkMRMLSegmentationNode"]
-        self.releaseUI.newBaselineSelector.setMRMLScene(slicer.mrmlScene)
         self.releaseUI.newBaselineSelector.noneEnabled = True
         self.releaseUI.newBaselineSelector.noneDisplay = "Select a baseline segmentation (required)"
         self.releaseUI.newBaselineSelector.toolTip = "Pick the segmentation to ship as the baseline for this release."
+        self.releaseUI.newBaselineSelector.setMRMLScene(slicer.mrmlScene)
         self.releaseUI.newBaselineSelector.setCurrentNode(None)
         self.releaseUI.newReleaseFormLayout.addRow("New baseline segmentation:", self.releaseUI.newBaselineSelector)
 
         self.releaseUI.newColorSelector = slicer.qMRMLColorTableComboBox()
-        self.releaseUI.newColorSelector.setMRMLScene(slicer.mrmlScene)
         self.releaseUI.newColorSelector.noneDisplay = "Select a color table (required)"
+        self.releaseUI.newColorSelector.setMRMLScene(slicer.mrmlScene)
         self.releaseUI.newColorSelector.setCurrentNode(None)
         self.releaseUI.newReleaseFormLayout.addRow("Color table:", self.releaseUI.newColorSelector)
 
@@ -415,7 +527,22 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
         # Insert before the existing Releases collapsible (refresh=0, repos=1, [insert here]=2, releases=3)
         self.releaseUI.verticalLayout.insertWidget(2, self.releaseUI.announcementCollapsibleButton)
 
-        # Search
+        self.updateScreenshotCount()
+
+        # Connections
+        self.releaseUI.refreshButton.clicked.connect(self.onRefreshReleaseTab)
+        self.releaseUI.repoList.itemDoubleClicked.connect(self.onReleaseRepoDoubleClicked)
+        self.releaseUI.makeReleaseButton.clicked.connect(self.onMakeRelease)
+        self.releaseUI.openReleasePageButton.clicked.connect(self.onOpenReleasePage)
+        self.releaseUI.announceButton.clicked.connect(self.onAnnounceUpcomingRelease)
+        self.releaseUI.newBaselineSelector.connect("currentNodeChanged(vtkMRMLNode*)", lambda _: self.updateMakeReleaseEnabled())
+        self.releaseUI.newColorSelector.connect("currentNodeChanged(vtkMRMLNode*)", lambda _: self.updateMakeReleaseEnabled())
+        self.releaseUI.takeScreenshotButton.clicked.connect(self.onTakeScreenshot)
+        self.releaseUI.reviewScreenshotsButton.clicked.connect(self.onReviewScreenshots)
+
+    def setupSearchTab(self, page):
+        self.searchUI = self.loadTabUI(page, "Search")
+
         self.searchUI.searchForm = MorphoDepotSearchForm(updateCallback=self.doSearch)
         self.searchUI.searchCollapsibleButton.layout().addWidget(self.searchUI.searchForm.topWidget)
         self.searchUI.searchForm.topWidget.enabled = False
@@ -438,53 +565,11 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
         self.searchUI.resultsButtonsLayout.addWidget(self.searchUI.saveSearchResultsButton)
         self.searchUI.resultsCollapsibleButton.layout().addLayout(self.searchUI.resultsButtonsLayout)
 
-
         # Connections
-        self.tabWidget.currentChanged.connect(self.onCurrentTabChanged)
-        self.configureUI.repoDirectory.comboBox().connect("currentTextChanged(QString)", self.onRepoDirectoryChanged)
-        self.configureUI.gitPath.comboBox().connect("currentTextChanged(QString)", self.onGitPathChanged)
-        self.configureUI.adminModeCheckBox.stateChanged.connect(self.onAdminModeChanged)
-        self.configureUI.userNameLineEdit.textChanged.connect(self.onUserNameChanged)
-        self.configureUI.userEmailLineEdit.textChanged.connect(self.onUserEmailChanged)
-        self.configureUI.ghPath.comboBox().connect("currentTextChanged(QString)", self.onGhPathChanged)
-        self.configureUI.reloadButton.clicked.connect(self.onReload)
-        self.createUI.createRepository.clicked.connect(self.onCreateRepository)
-        self.createUI.openRepository.clicked.connect(self.onOpenRepository)
-        self.createUI.clearForm.clicked.connect(self.onClearForm)
-        self.createUI.fillFormForTestingButton.clicked.connect(self.onFillFormForTesting)
-        self.createUI.reviewScreenshotsButton.clicked.connect(self.onReviewScreenshots)
-        self.createUI.takeScreenshotButton.clicked.connect(self.onTakeScreenshot)
-        self.annotateUI.issueList.itemDoubleClicked.connect(self.onIssueDoubleClicked)
-        self.annotateUI.prList.itemSelectionChanged.connect(self.onPRSelectionChanged)
-        self.annotateUI.messageTitle.textChanged.connect(self.onCommitMessageChanged)
-        self.annotateUI.commitButton.clicked.connect(self.onCommit)
-        self.annotateUI.reviewButton.clicked.connect(self.onRequestReview)
-        self.annotateUI.refreshButton.connect("clicked(bool)", self.onRefresh)
-        self.annotateUI.openPRPageButton.clicked.connect(self.onOpenPRPageButtonClicked)
-        self.reviewUI.refreshButton.connect("clicked(bool)", self.onReviewRefresh)
-        self.reviewUI.prList.itemDoubleClicked.connect(self.onPRDoubleClicked)
-        self.reviewUI.hideDraftsCheckBox.stateChanged.connect(self.onHideDraftsChanged)
-        self.reviewUI.requestChangesButton.clicked.connect(self.onRequestChanges)
-        self.reviewUI.approveButton.clicked.connect(self.onApprove)
-        self.releaseUI.refreshButton.clicked.connect(self.onRefreshReleaseTab)
-        self.releaseUI.repoList.itemDoubleClicked.connect(self.onReleaseRepoDoubleClicked)
-        self.releaseUI.makeReleaseButton.clicked.connect(self.onMakeRelease)
-        self.releaseUI.openReleasePageButton.clicked.connect(self.onOpenReleasePage)
-        self.releaseUI.announceButton.clicked.connect(self.onAnnounceUpcomingRelease)
-        self.releaseUI.newBaselineSelector.connect("currentNodeChanged(vtkMRMLNode*)", lambda _: self.updateMakeReleaseEnabled())
-        self.releaseUI.newColorSelector.connect("currentNodeChanged(vtkMRMLNode*)", lambda _: self.updateMakeReleaseEnabled())
-        self.releaseUI.takeScreenshotButton.clicked.connect(self.onTakeScreenshot)
-        self.releaseUI.reviewScreenshotsButton.clicked.connect(self.onReviewScreenshots)
         self.searchUI.resultsTable.doubleClicked.connect(self.onSearchResultsDoubleClicked)
         self.searchUI.refreshButton.clicked.connect(self.onRefreshSearch)
         self.searchUI.saveSearchResultsButton.clicked.connect(self.onSaveSearchResults)
 
-        # set initial visibility of admin tab
-        self.onAdminModeChanged(self.configureUI.adminModeCheckBox.checkState())
-        self.reviewUI.hideDraftsCheckBox.checked = self.hidePRDrafts
-
-        self.updateRefreshButtonLabels()
-
     def cleanup(self) -> None:
         """Called when the application closes and the module widget is destroyed."""
         self.removeObservers()
@@ -500,6 +585,7 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
 
     def onCurrentTabChanged(self,index):
         qt.QSettings().setValue("MorphoDepot/tabIndex", index)
+        self.ensureTabBuilt(index)
         self.updateRefreshButtonLabels()
 
     def updateRefreshButtonLabels(self):
@@ -509,9 +595,11 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
             suffix = f" (user: {user})"
         except Exception:
             suffix = ""
-        self.annotateUI.refreshButton.text = f"Refresh Github{suffix}"
-        self.reviewUI.refreshButton.text = f"Refresh Github{suffix}"
-        self.releaseUI.refreshButton.text = f"Refresh Github{suffix}"
+        # tabs that are not built yet pick up the text when they are
+        self.refreshButtonText = f"Refresh Github{suffix}"
+        for ui in (self.annotateUI, self.reviewUI, self.releaseUI):
+            if ui is not None:
+                ui.refreshButton.text = self.refreshButtonText
 
     def onAdminModeChanged(self, state):
         isAdmin = (state == qt.Qt.Checked)
@@ -522,7 +610,7 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
         userNameLabel = self.configureUI.gitConfigLayout.labelForField(self.configureUI.userNameLineEdit)
         userEmailLabel = self.configureUI.gitConfigLayout.labelForField(self.configureUI.userEmailLineEdit)
 
-        gitIsWorking = self.logic.gitExecutablePath and self.logic.checkCommand([self.logic.gitExecutablePath, '--version'])
+        gitIsWorking = self.logic.gitExecutableWorks()
 
         self.configureUI.userNameLineEdit.enabled = gitIsWorking
         self.configureUI.userEmailLineEdit.enabled = gitIsWorking
@@ -565,12 +653,11 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
         sourceSegmentation = self.createUI.segmentationSelector.currentNode()
         colorTable = self.createUI.colorSelector.currentNode()
 
-        validGithubAsset = r'^[a-zA-Z0-9]([a-zA-Z0-9._-]*[a-zA-Z0-9])?$'
-        if re.fullmatch(validGithubAsset, sourceVolume.GetName()) is None:
+        if self.validGithubAsset.fullmatch(sourceVolume.GetName()) is None:
             slicer.util.errorDisplay("Please rename volume.\n"
                 "Only alphanumerics, periods, hyphens and underscores accepted.")
             return
-        if re.fullmatch(validGithubAsset, colorTable.GetName()) is None:
+        if self.validGithubAsset.fullmatch(colorTable.GetName()) is None:
             slicer.util.errorDisplay("Please rename color table.\n"
                 "Only alphanumerics, periods, hyphens and underscores accepted.\n"
                 "Use the 'All nodes' tab of the Data module to access the color table and right-click to rename.")
@@ -816,54 +903,55 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
             self.logic.ghTopicClearCache()
             self.annotateUI.issueList.clear()
             self.annotateUI.prList.clear()
-            self.updateIssueList()
-            self.updateAnnotatePRList()
+            # both lists are filtered from the same account and topic data
+            me, repoData = self.logic.ghDashboardData()
+            self.updateIssueList(me, repoData)
+            self.updateAnnotatePRList(me, repoData)
 
     def updateScreenshotCount(self):
         count = len(self.screenshots)
         text = f"{count} screenshot{'s' if count != 1 else ''} taken"
-        self.createUI.screenshotCountLabel.text = text
-        self.createUI.reviewScreenshotsButton.enabled = count > 0
-        if hasattr(self.releaseUI, 'screenshotCountLabel'):
-            self.releaseUI.screenshotCountLabel.text = text
-            self.releaseUI.reviewScreenshotsButton.enabled = count > 0
+        for ui in (self.createUI, self.releaseUI):
+            if ui is not None:
+                ui.screenshotCountLabel.text = text
+                ui.reviewScreenshotsButton.enabled = count > 0
 
     def onCommitMessageChanged(self, text):
         commitEnabled = (text != "")
         self.annotateUI.commitButton.enabled = commitEnabled
 
-    def updateIssueList(self):
+    def updateIssueList(self, me=None, repoData=None):
         slicer.util.showStatusMessage(f"Updating issues")
+        issueList = self.logic.issueList(me, repoData)
+        self.issues = issueList
+        issueTitles = [f"{issue['title']} {issue['repository']['nameWithOwner']}, #{issue['number']}" for issue in issueList]
+        self.annotateUI.issueList.setUpdatesEnabled(False)
         self.annotateUI.issueList.clear()
-        self.issuesByItem = {}
-        issueList = self.logic.issueList()
-        for issue in issueList:
-            issueTitle = f"{issue['title']} {issue['repository']['nameWithOwner']}, #{issue['number']}"
-            item = qt.QListWidgetItem(issueTitle)
-            self.issuesByItem[item] = issue
-            self.annotateUI.issueList.addItem(item)
+        self.annotateUI.issueList.addItems(issueTitles)
+        self.annotateUI.issueList.setUpdatesEnabled(True)
         slicer.util.showStatusMessage(f"{len(issueList)} issues")
 
-    def updateAnnotatePRList(self):
+    def updateAnnotatePRList(self, me=None, repoData=None):
         slicer.util.showStatusMessage(f"Updating PRs")
+        prList = self.logic.prList(role="segmenter", me=me, repoData=repoData)
+        self.annotatePRs = prList
+        self.annotateUI.prList.setUpdatesEnabled(False)
         self.annotateUI.prList.clear()
-        self.prsByItem = {}
-        prList = self.logic.prList(role="segmenter")
-        for pr in prList:
-            prStatus = 'draft' if pr['isDraft'] else 'ready for review'
-            prTitle = f"{pr['title']} {pr['issueTitles']} {pr['repository']['nameWithOwner']}: {prStatus}"
-            item = qt.QListWidgetItem(prTitle)
-            self.prsByItem[item] = pr
-            self.annotateUI.prList.addItem(item)
+        self.annotateUI.prList.addItems([self.prTitle(pr) for pr in prList])
+        self.annotateUI.prList.setUpdatesEnabled(True)
         slicer.util.showStatusMessage(f"{len(prList)} prs")
 
+    def prTitle(self, pr):
+        prStatus = 'draft' if pr['isDraft'] else 'ready for review'
+        return f"{pr['title']} {pr['issueTitles']} {pr['repository']['nameWithOwner']}: {prStatus}"
+
     def onPRSelectionChanged(self):
         self.annotateUI.openPRPageButton.enabled = False
         self.selectedPR = None
         selectedItems = self.annotateUI.prList.selectedItems()
         if selectedItems:
             item = selectedItems[0]
-            self.selectedPR = self.prsByItem[item]
+            self.selectedPR = self.annotatePRs[self.annotateUI.prList.row(item)]
             self.annotateUI.openPRPageButton.enabled = True
 
     def onOpenPRPageButtonClicked(self):
@@ -878,8 +966,7 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
 
     def onIssueDoubleClicked(self, item):
         slicer.util.showStatusMessage(f"Loading {item.text()}")
-        repoDirectory = os.path.normpath(self.configureUI.repoDirectory.currentPath)
-        issue = self.issuesByItem[item]
+        issue = self.issues[self.annotateUI.issueList.row(item)]
         if self.testingMode or slicer.util.confirmOkCancelDisplay("Close scene and load issue?"):
             with slicer.util.tryWithErrorDisplay("Failed to load issue", waitCursor=True):
                 slicer.util.showStatusMessage(f"Loading {item.text()}")
@@ -888,7 +975,7 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
                 self.annotateUI.currentIssueLabel.text = f"Issue: {item.text()}"
                 slicer.mrmlScene.Clear()
                 try:
-                    self.logic.loadIssue(issue, repoDirectory)
+                    self.logic.loadIssue(issue, self.repoDirectoryPath)
                     self.annotateUI.forkManagementCollapsibleButton.enabled = True
                     segmentation = self.logic.segmentationNode.GetSegmentation()
                     segmentationLogic = slicer.modules.segmentations.logic()
@@ -976,8 +1063,7 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
                 self.updateAnnotatePRList()
                 self.annotateUI.reviewButton.enabled = True
             else:
-                path = os.path.normpath(self.configureUI.repoDirectory.currentPath)
-                slicer.util.messageBox(f"Commit failed.\nYour repository conflicts with what's on github. Copy your work from {path} and then delete the local repository folder and restart the issues.")
+                slicer.util.messageBox(f"Commit failed.\nYour repository conflicts with what's on github. Copy your work from {self.repoDirectoryPath} and then delete the local repository folder and restart the issues.")
                 slicer.util.showStatusMessage(f"Commit and push failed")
 
     def onRequestReview(self):
@@ -993,18 +1079,23 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
             self.annotateUI.messageBody.plainText = ""
 
     def onRepoDirectoryChanged(self):
-        logging.info(f"Setting repoDirectory to be {os.path.normpath(self.configureUI.repoDirectory.currentPath)}")
-        self.logic.setLocalRepositoryDirectory(os.path.normpath(self.configureUI.repoDirectory.currentPath))
+        self.repoDirectoryPath = os.path.normpath(self.configureUI.repoDirectory.currentPath)
+        logging.info(f"Setting repoDirectory to be {self.repoDirectoryPath}")
+        self.logic.setLocalRepositoryDirectory(self.repoDirectoryPath)
 
     def onGitPathChanged(self):
-        logging.info(f"Setting gitPath to be {os.path.normpath(self.configureUI.gitPath.currentPath)}")
-        qt.QSettings().setValue("MorphoDepot/gitPath", os.path.normpath(self.configureUI.gitPath.currentPath))
+        gitPath = os.path.normpath(self.configureUI.gitPath.currentPath)
+        logging.info(f"Setting gitPath to be {gitPath}")
+        qt.QSettings().setValue("MorphoDepot/gitPath", gitPath)
+        self.dependenciesAvailable = False
         self.setupLogic()
         self.enter()
 
     def onGhPathChanged(self):
-        logging.info(f"Setting ghPath to be {os.path.normpath(self.configureUI.ghPath.currentPath)}")
-        qt.QSettings().setValue("MorphoDepot/ghPath", os.path.normpath(self.configureUI.ghPath.currentPath))
+        ghPath = os.path.normpath(self.configureUI.ghPath.currentPath)
+        logging.info(f"Setting ghPath to be {ghPath}")
+        qt.QSettings().setValue("MorphoDepot/ghPath", ghPath)
+        self.dependenciesAvailable = False
         self.setupLogic()
         self.enter()
 
@@ -1018,23 +1109,16 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
         with slicer.util.tryWithErrorDisplay("Failed to update PR list", waitCursor=True):
             slicer.util.showStatusMessage(f"Updating PRs")
             self.reviewUI.prList.clear()
-            self.prsByItem = {}
             prList = self.logic.prList(role="reviewer")
-            prCount = 0
-            for pr in prList:
-                if self.hidePRDrafts and pr['isDraft']:
-                    continue
-                prStatus = 'draft' if pr['isDraft'] else 'ready for review'
-                prTitle = f"{pr['title']} {pr['issueTitles']} {pr['repository']['nameWithOwner']}: {prStatus}"
-                item = qt.QListWidgetItem(prTitle)
-                prCount += 1
-                self.prsByItem[item] = pr
-                self.reviewUI.prList.addItem(item)
+            self.reviewPRs = [pr for pr in prList if not (self.hidePRDrafts and pr['isDraft'])]
+            self.reviewUI.prList.setUpdatesEnabled(False)
+            self.reviewUI.prList.addItems([self.prTitle(pr) for pr in self.reviewPRs])
+            self.reviewUI.prList.setUpdatesEnabled(True)
             slicer.util.showStatusMessage(f"{len(prList)} prs")
 
     def onPRDoubleClicked(self, item):
         repoDirectory = self.logic.localRepositoryDirectory()
-        pr = self.prsByItem[item]
+        pr = self.reviewPRs[self.reviewUI.prList.row(item)]
         if self.testingMode or slicer.util.confirmOkCancelDisplay("Close scene and load PR?"):
             with slicer.util.tryWithErrorDisplay("Failed to load PR", waitCursor=True):
                 slicer.util.showStatusMessage(f"Loading {item.text()}")
@@ -1079,24 +1163,26 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
             self.releaseUI.currentVersionLabel.text = "Current version: None"
             self.releaseUI.sourceVolumeLabel.text = ""
             self.releaseUI.openReleasePageButton.enabled = False
-            self.reposByItem = {}
             administratedRepos = self.logic.administratedRepoList()
+            self.releaseRepos = administratedRepos
+            labels = []
             for repo in administratedRepos:
                 issues = repo.get('issues', {}).get('totalCount', 0)
                 prs = repo.get('pullRequests', {}).get('totalCount', 0)
                 issueLabel = "issue" if issues == 1 else "issues"
                 prLabel = "PR" if prs == 1 else "PRs"
-                label = f"{repo['nameWithOwner']}  ({issues} open {issueLabel}, {prs} open {prLabel})"
-                item = qt.QListWidgetItem(label)
+                labels.append(f"{repo['nameWithOwner']}  ({issues} open {issueLabel}, {prs} open {prLabel})")
+            self.releaseUI.repoList.setUpdatesEnabled(False)
+            self.releaseUI.repoList.addItems(labels)
+            for row, repo in enumerate(administratedRepos):
                 tooltip = self.repoTooltip(repo)
                 if tooltip:
-                    item.setToolTip(tooltip)
-                self.reposByItem[item] = repo
-                self.releaseUI.repoList.addItem(item)
+                    self.releaseUI.repoList.item(row).setToolTip(tooltip)
+            self.releaseUI.repoList.setUpdatesEnabled(True)
             slicer.util.showStatusMessage(f"Found {len(administratedRepos)} owned repositories.")
 
     def onReleaseRepoDoubleClicked(self, item):
-        repoData = self.reposByItem[item]
+        repoData = self.releaseRepos[self.releaseUI.repoList.row(item)]
         slicer.util.showStatusMessage(f"Loading repository {repoData['nameWithOwner']}...")
         if self.testingMode or slicer.util.confirmOkCancelDisplay("Close scene and load repository?"):
             slicer.mrmlScene.Clear()
@@ -1316,7 +1402,7 @@ class MorphoDepotWidget(ScriptedLoadableModuleWidget, VTKObservationMixin, Enabl
                     if not os.path.exists(localImagePath):
                         try:
                             os.makedirs(os.path.dirname(localImagePath), exist_ok=True)
-                            slicer.util.downloadFile(imageURL, localImagePath)
+                            self.logic.downloadFile(imageURL, localImagePath)
                         except Exception as e:
                             logging.warning(f"Could not download screenshot {imageURL}: {e}")
 
@@ -1572,6 +1658,29 @@ class MorphoDepotAccessionForm():
         7: "Github"
     }
 
+    # questions created by each section builder
+    sectionQuestions = {
+        0: ["subjectType"],
+        1: ["specimenSource"],
+        2: ["iDigBioAccessioned", "iDigBioURL"],
+        3: ["species", "biologicalSex", "developmentalStage"],
+        4: ["modality", "contrastEnhancement", "imageContents"],
+        "4a": ["otherSubjectDescription"],
+        5: ["anatomicalAreas"],
+        6: ["redistributionAcknowledgement", "license"],
+        7: ["githubRepoName", "repoType"],
+    }
+
+    # questions answered with FormCheckBoxesQuestion, whose answer is a list
+    multipleChoiceQuestions = ["anatomicalAreas", "redistributionAcknowledgement"]
+
+    # answers that decide which sections and questions are shown
+    visibilityQuestions = ["subjectType", "specimenSource", "iDigBioAccessioned", "imageContents"]
+
+    # patterns checked by validateForm on every change
+    repoNameRegex = re.compile(r"^(?:([a-zA-Z\d]+(?:-[a-zA-Z\d]+)*)/)?([\w.-]+)$")
+    emailRegex = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
     formQuestions = {
         # each question is a tuple of question, answer options, and tooltip
         # This info is pure data, but is closely coupled to the GUI and validation code below for usability
@@ -1691,6 +1800,7 @@ class MorphoDepotAccessionForm():
         else:
             self.topWidget = self.form
         self.sectionWidgets = {}
+        self.sectionVisibility = {}
         self.sectionSections = {}
         for sectionKey in sectionKeys:
             sectionWidget = qt.QWidget()
@@ -1725,23 +1835,62 @@ class MorphoDepotAccessionForm():
             self.sectionWidgets[sectionKey] = sectionWidget
             self.form.layout().addWidget(sectionWidget)
 
-        form = MorphoDepotAccessionForm.formQuestions
-        self.questions = {}
+        self.questions = FormQuestionDict(self.materializeQuestion)
+        # answers of visibilityQuestions when section visibility was last updated
+        self.visibilityAnswers = None
+        # text question key -> (version, result), see checkTextAnswer
+        self.textChecks = {}
+
+        # text edits revalidate once typing pauses rather than on every keystroke
+        self.validateTimer = qt.QTimer()
+        self.validateTimer.setSingleShot(True)
+        self.validateTimer.setInterval(150)
+        self.validateTimer.timeout.connect(self.validateForm)
+
+        # Section contents are only created the first time the section is shown;
+        # most sections stay hidden until earlier answers make them relevant.
+        self.sectionBuilders = {
+            0: self.buildSection0,
+            1: self.buildSection1,
+            2: self.buildSection2,
+            3: self.buildSection3,
+            4: self.buildSection4,
+            "4a": self.buildSection4a,
+            5: self.buildSection5,
+            6: self.buildSection6,
+            7: self.buildSection7,
+        }
+        for sectionKey in [0, 4, 6, 7]:
+            self.materializeSection(sectionKey)
+
+        if self.workflowMode:
+            self.showSection(0)
+
+        self.validateForm()
+
+    def materializeSection(self, sectionKey):
+        """Create the questions of a section if that has not happened yet"""
+        builder = self.sectionBuilders.pop(sectionKey, None)
+        if builder:
+            builder(self.sectionWidgets[sectionKey].layout(), MorphoDepotAccessionForm.formQuestions)
+
+    def materializeQuestion(self, key):
+        """Create the section that owns the question, so questions[key] works before it is shown"""
+        for sectionKey, questionKeys in MorphoDepotAccessionForm.sectionQuestions.items():
+            if key in questionKeys:
+                self.materializeSection(sectionKey)
 
-        # section 0
-        layout = self.sectionWidgets[0].layout()
+    def buildSection0(self, layout, form):
         q,a,t = form["subjectType"]
         self.questions["subjectType"] = FormRadioQuestion(q, a, self.validateForm)
         layout.addWidget(self.questions["subjectType"].questionBox)
 
-        # section 1
-        layout = self.sectionWidgets[1].layout()
+    def buildSection1(self, layout, form):
         q,a,t = form["specimenSource"]
         self.questions["specimenSource"] = FormRadioQuestion(q, a, self.validateForm)
         layout.addWidget(self.questions["specimenSource"].questionBox)
 
-        # section 2
-        layout = self.sectionWidgets[2].layout()
+    def buildSection2(self, layout, form):
         q,a,t = form["iDigBioAccessioned"]
         self.questions["iDigBioAccessioned"] = FormRadioQuestion(q, a, self.validateForm)
         layout.addWidget(self.questions["iDigBioAccessioned"].questionBox)
@@ -1749,14 +1898,13 @@ class MorphoDepotAccessionForm():
         self.gotoiDigBioButton.connect("clicked()", lambda : qt.QDesktopServices.openUrl(qt.QUrl("https://iDigBio.org")))
         layout.addWidget(self.gotoiDigBioButton)
         q,a,t = form["iDigBioURL"]
-        self.questions["iDigBioURL"] = FormTextQuestion(q, self.validateForm)
+        self.questions["iDigBioURL"] = FormTextQuestion(q, self.validateFormSoon)
         self.questions["iDigBioURL"].questionBox.toolTip = t
         layout.addWidget(self.questions["iDigBioURL"].questionBox)
 
-        # section 3
-        layout = self.sectionWidgets[3].layout()
+    def buildSection3(self, layout, form):
         q,a,t = form["species"]
-        self.questions["species"] = FormSpeciesQuestion(q, self.validateForm)
+        self.questions["species"] = FormSpeciesQuestion(q, self.validateFormSoon)
         self.questions["species"].questionBox.toolTip = t
         layout.addWidget(self.questions["species"].questionBox)
         self.gotoGBIFButton = qt.QPushButton("Open GBIF")
@@ -1769,8 +1917,7 @@ class MorphoDepotAccessionForm():
         self.questions["developmentalStage"] = FormRadioQuestion(q, a, self.validateForm)
         layout.addWidget(self.questions["developmentalStage"].questionBox)
 
-        # section 4
-        layout = self.sectionWidgets[4].layout()
+    def buildSection4(self, layout, form):
         q,a,t = form["modality"]
         self.questions["modality"] = FormRadioQuestion(q, a, self.validateForm)
         layout.addWidget(self.questions["modality"].questionBox)
@@ -1781,20 +1928,17 @@ class MorphoDepotAccessionForm():
         self.questions["imageContents"] = FormRadioQuestion(q, a, self.validateForm)
         layout.addWidget(self.questions["imageContents"].questionBox)
 
-        # section 4a
-        layout = self.sectionWidgets["4a"].layout()
+    def buildSection4a(self, layout, form):
         q,a,t = form["otherSubjectDescription"]
-        self.questions["otherSubjectDescription"] = FormTextQuestion(q, self.validateForm)
+        self.questions["otherSubjectDescription"] = FormTextQuestion(q, self.validateFormSoon)
         layout.addWidget(self.questions["otherSubjectDescription"].questionBox)
 
-        # section 5
-        layout = self.sectionWidgets[5].layout()
+    def buildSection5(self, layout, form):
         q,a,t = form["anatomicalAreas"]
         self.questions["anatomicalAreas"] = FormCheckBoxesQuestion(q, a, self.validateForm)
         layout.addWidget(self.questions["anatomicalAreas"].questionBox)
 
-        # section 6
-        layout = self.sectionWidgets[6].layout()
+    def buildSection6(self, layout, form):
         q,a,t = form["redistributionAcknowledgement"]
         self.questions["redistributionAcknowledgement"] = FormCheckBoxesQuestion(q, a, self.validateForm)
         layout.addWidget(self.questions["redistributionAcknowledgement"].questionBox)
@@ -1803,10 +1947,9 @@ class MorphoDepotAccessionForm():
         self.questions["license"].optionButtons[a[0]].checked=True
         layout.addWidget(self.questions["license"].questionBox)
 
-        # section 7
-        layout = self.sectionWidgets[7].layout()
+    def buildSection7(self, layout, form):
         q,a,t = form["githubRepoName"]
-        self.questions["githubRepoName"] = FormTextQuestion(q, self.validateForm)
+        self.questions["githubRepoName"] = FormTextQuestion(q, self.validateFormSoon)
         self.questions["githubRepoName"].questionBox.toolTip = t
         layout.addWidget(self.questions["githubRepoName"].questionBox)
         q,a,t = form["repoType"]
@@ -1814,107 +1957,158 @@ class MorphoDepotAccessionForm():
         layout.addWidget(self.questions["repoType"].questionBox)
 
         emailTooltip = "Your email will be added to the MorphoDepot contact list so you can be notified about new features and updates"
-        self.contactEmailQuestion = FormTextQuestion("What is your email address?", self.validateForm)
+        self.contactEmailQuestion = FormTextQuestion("What is your email address?", self.validateFormSoon)
         self.contactEmailQuestion.questionBox.toolTip = emailTooltip
         layout.addWidget(self.contactEmailQuestion.questionBox)
-        self.contactEmailConfirmQuestion = FormTextQuestion("Confirm your email address:", self.validateForm)
+        self.contactEmailConfirmQuestion = FormTextQuestion("Confirm your email address:", self.validateFormSoon)
         self.contactEmailConfirmQuestion.questionBox.toolTip = emailTooltip
         layout.addWidget(self.contactEmailConfirmQuestion.questionBox)
 
-        if self.workflowMode:
-            self.showSection(0)
+    def setSectionVisible(self, sectionKey, visible):
+        """Show or hide a section, touching the widget only when its visibility changes"""
+        if self.sectionVisibility.get(sectionKey) == visible:
+            return
+        if visible:
+            self.materializeSection(sectionKey)
+        self.sectionWidgets[sectionKey].setVisible(visible)
+        self.sectionVisibility[sectionKey] = visible
 
-        self.validateForm()
+    def answer(self, key):
+        """Answer to a question, or the empty answer if its section was never shown"""
+        if key in self.questions:
+            return self.questions[key].answer()
+        return [] if key in MorphoDepotAccessionForm.multipleChoiceQuestions else ""
 
     def showSection(self, section):
         if self.workflowMode:
-            for sectionWidget in self.sectionWidgets.values():
-                sectionWidget.hide()
-            self.sectionWidgets[section].show()
+            for sectionKey in self.sectionWidgets:
+                self.setSectionVisible(sectionKey, False)
+            self.setSectionVisible(section, True)
+
+    @staticmethod
+    def isiDigBioRecordURL(url):
+        return url.startswith("https://portal.idigbio.org/portal/records")
+
+    @staticmethod
+    def isBinomialName(name):
+        return len(name.split()) == 2
+
+    @classmethod
+    def isValidRepoName(cls, name):
+        return cls.repoNameRegex.match(name) != None
+
+    def checkTextAnswer(self, key, check):
+        """Result of check() on a text answer, only recomputed after the text changes"""
+        question = self.questions.get(key)
+        if question is None:
+            return check("")
+        version, result = self.textChecks.get(key, (None, None))
+        if version != question.version:
+            version, result = question.version, check(question.answer())
+            self.textChecks[key] = (version, result)
+        return result
+
+    def validateFormSoon(self, arguments=None):
+        """Restart the validation timer so a burst of edits is validated once"""
+        self.validateTimer.start()
 
     def validateForm(self, arguments=None):
+        answers = {key: self.answer(key) for key in MorphoDepotAccessionForm.formQuestions}
+        isBiological = (answers["subjectType"] == "Biological specimen")
 
-        # first, update the visibility of dependent sections
-        isBiological = (self.questions["subjectType"].answer() == "Biological specimen")
-
-        self.sectionWidgets[1].setVisible(isBiological)
-        self.sectionWidgets[2].setVisible(isBiological)
-        self.sectionWidgets[3].setVisible(isBiological)
-        self.sectionWidgets["4a"].setVisible(not isBiological)
-        # Also hide some questions in section 4 for non-biological
-        self.questions["contrastEnhancement"].questionBox.setVisible(isBiological)
-        self.questions["imageContents"].questionBox.setVisible(isBiological)
-
-        if isBiological:
-            if self.questions["specimenSource"].answer() == "Non-accessioned":
-                self.sectionWidgets[2].hide()
-            else:
-                self.sectionWidgets[2].show()
-                if self.questions["iDigBioAccessioned"].answer() == "Yes":
-                    self.questions["iDigBioURL"].questionBox.show()
-                    self.gotoiDigBioButton.show()
-                else:
-                    self.questions["iDigBioURL"].questionBox.hide()
-                    self.gotoiDigBioButton.hide()
-
-            if self.questions["imageContents"].answer() == "Partial specimen":
-                self.sectionWidgets[5].show()
-            else:
-                self.sectionWidgets[5].hide()
-        else: # Not biological
-            self.sectionWidgets[2].hide()
-            self.sectionWidgets[3].hide()
-            self.sectionWidgets[5].hide()
+        # first, update the visibility of dependent sections,
+        # but only when one of the answers that controls it has changed
+        visibilityAnswers = tuple(answers[key] for key in MorphoDepotAccessionForm.visibilityQuestions)
+        if visibilityAnswers != self.visibilityAnswers:
+            self.visibilityAnswers = visibilityAnswers
+            self.updateSectionVisibility(answers, isBiological)
 
         # then check if required elements have been filled out
         valid = True
 
-        if self.questions["subjectType"].answer() == "":
+        if answers["subjectType"] == "":
             valid = False
 
         if isBiological:
-            if self.questions["specimenSource"].answer() == "":
+            if answers["specimenSource"] == "":
                 valid = False
-            if self.questions["specimenSource"].answer() == "Accessioned specimen":
-                if self.questions["iDigBioAccessioned"].answer() == "Yes":
-                    if not self.questions["iDigBioURL"].answer().startswith("https://portal.idigbio.org/portal/records"):
+            if answers["specimenSource"] == "Accessioned specimen":
+                if answers["iDigBioAccessioned"] == "Yes":
+                    if not self.checkTextAnswer("iDigBioURL", self.isiDigBioRecordURL):
                         valid = False
 
             # Section 3 is always required for biological
-            valid = valid and self.questions["species"].answer() != ""
-            valid = valid and (len(self.questions["species"].answer().split()) == 2)
-            valid = valid and self.questions["biologicalSex"].answer() != ""
-            valid = valid and self.questions["developmentalStage"].answer() != ""
+            valid = valid and answers["species"] != ""
+            valid = valid and self.checkTextAnswer("species", self.isBinomialName)
+            valid = valid and answers["biologicalSex"] != ""
+            valid = valid and answers["developmentalStage"] != ""
 
-            if self.questions["imageContents"].answer() == "Partial specimen":
-                valid = valid and self.questions["anatomicalAreas"].answer() != []
+            if answers["imageContents"] == "Partial specimen":
+                valid = valid and answers["anatomicalAreas"] != []
         else: # Not biological
-            valid = valid and self.questions["otherSubjectDescription"].answer() != ""
+            valid = valid and answers["otherSubjectDescription"] != ""
 
-        valid = valid and self.questions["modality"].answer() != ""
+        valid = valid and answers["modality"] != ""
         if isBiological:
-            valid = valid and self.questions["contrastEnhancement"].answer() != ""
-            valid = valid and self.questions["imageContents"].answer() != ""
-        valid = valid and self.questions["redistributionAcknowledgement"].answer() != []
-        valid = valid and self.questions["license"].answer() != ""
-        valid = valid and self.questions["githubRepoName"].answer() != ""
-        valid = valid and self.questions["repoType"].answer() != ""
-        repoNameRegex = r"^(?:([a-zA-Z\d]+(?:-[a-zA-Z\d]+)*)/)?([\w.-]+)$"
-        valid = valid and (re.match(repoNameRegex, self.questions["githubRepoName"].answer()) != None)
-        emailRegex = r'^[^@\s]+@[^@\s]+\.[^@\s]+$'
+            valid = valid and answers["contrastEnhancement"] != ""
+            valid = valid and answers["imageContents"] != ""
+        valid = valid and answers["redistributionAcknowledgement"] != []
+        valid = valid and answers["license"] != ""
+        valid = valid and answers["githubRepoName"] != ""
+        valid = valid and answers["repoType"] != ""
+        valid = valid and self.checkTextAnswer("githubRepoName", self.isValidRepoName)
         email = self.contactEmailQuestion.answer().strip()
-        valid = valid and bool(re.match(emailRegex, email))
+        valid = valid and bool(self.emailRegex.match(email))
         valid = valid and (email == self.contactEmailConfirmQuestion.answer().strip().lower() or
                            email.lower() == self.contactEmailConfirmQuestion.answer().strip().lower())
         self.validationCallback(valid)
 
+    def updateSectionVisibility(self, answers, isBiological):
+        self.setSectionVisible(1, isBiological)
+        self.setSectionVisible(3, isBiological)
+        self.setSectionVisible("4a", not isBiological)
+        # Also hide some questions in section 4 for non-biological
+        self.questions["contrastEnhancement"].questionBox.setVisible(isBiological)
+        self.questions["imageContents"].questionBox.setVisible(isBiological)
+
+        if isBiological:
+            if answers["specimenSource"] == "Non-accessioned":
+                self.setSectionVisible(2, False)
+            else:
+                self.setSectionVisible(2, True)
+                if answers["iDigBioAccessioned"] == "Yes":
+                    self.questions["iDigBioURL"].questionBox.show()
+                    self.gotoiDigBioButton.show()
+                else:
+                    self.questions["iDigBioURL"].questionBox.hide()
+                    self.gotoiDigBioButton.hide()
+
+            if answers["imageContents"] == "Partial specimen":
+                self.setSectionVisible(5, True)
+            else:
+                self.setSectionVisible(5, False)
+        else: # Not biological
+            self.setSectionVisible(2, False)
+            self.setSectionVisible(5, False)
+
     def accessionData(self):
         data = {}
-        for key in MorphoDepotAccessionForm.formQuestions.keys():
-            data[key] = (self.questions[key].questionLabel.text, self.questions[key].answer())
+        for key, (question, options, tooltip) in MorphoDepotAccessionForm.formQuestions.items():
+            data[key] = (question, self.answer(key))
         return data
 
 
+class FormQuestionDict(dict):
+    """Questions of an accession form by key.  Indexing a question whose section
+    has not been created yet creates it; get() and `in` do not"""
+    def __init__(self, materializeQuestion):
+        super().__init__()
+        self.materializeQuestion = materializeQuestion
+
+    def __missing__(self, key):
+        self.materializeQuestion(key)
+        return dict.__getitem__(self, key)
+
 class FormBaseQuestion():
     def __init__(self, question):
         self.questionBox = qt.QWidget()
@@ -1932,41 +2126,59 @@ class FormRadioQuestion(FormBaseQuestion):
     def __init__(self, question, options, validator):
         super().__init__(question)
         self.optionButtons = {}
+        # kept current from toggled(), which also fires when checked is set from code
+        self.selectedOption = ""
         for option in options:
             self.optionButtons[option] = qt.QRadioButton(option)
+            self.optionButtons[option].connect("toggled(bool)", lambda checked, option=option: self.onToggled(option, checked))
             self.optionButtons[option].connect("clicked()", validator)
             self.questionLayout.addWidget(self.optionButtons[option])
 
+    def onToggled(self, option, checked):
+        if checked:
+            self.selectedOption = option
+        elif self.selectedOption == option:
+            self.selectedOption = ""
+
     def answer(self):
-        for option,button in self.optionButtons.items():
-            if button.checked:
-                return option
-        return ""
+        return self.selectedOption
 
 
 class FormCheckBoxesQuestion(FormBaseQuestion):
     def __init__(self, question, options, validator):
         super().__init__(question)
         self.optionButtons = {}
+        # kept current from toggled(), which also fires when checked is set from code
+        self.selectedOptions = set()
         for option in options:
             self.optionButtons[option] = qt.QCheckBox(option)
+            self.optionButtons[option].connect("toggled(bool)", lambda checked, option=option: self.onToggled(option, checked))
             self.optionButtons[option].connect("clicked()", validator)
             self.questionLayout.addWidget(self.optionButtons[option])
 
+    def onToggled(self, option, checked):
+        if checked:
+            self.selectedOptions.add(option)
+        else:
+            self.selectedOptions.discard(option)
+
     def answer(self):
-        answers = []
-        for option,button in self.optionButtons.items():
-            if button.checked:
-                answers.append(option)
-        return answers
+        # in option order, as listed in the form
+        return [option for option in self.optionButtons if option in self.selectedOptions]
 
 class FormTextQuestion(FormBaseQuestion):
     def __init__(self, question, validator):
         super().__init__(question)
         self.answerText = qt.QLineEdit()
+        # incremented on every edit so derived checks can be reused until the text changes
+        self.version = 0
+        self.answerText.connect("textChanged(QString)", self.onTextChanged)
         self.answerText.connect("textChanged(QString)", validator)
         self.questionLayout.addWidget(self.answerText)
 
+    def onTextChanged(self, text):
+        self.version += 1
+
     def answer(self):
         return self.answerText.text
 
@@ -2005,6 +2217,11 @@ class FormSpeciesQuestion(FormTextQuestion):
             self.searchDialogLayout = qt.QVBoxLayout()
             self.searchDialog.setLayout(self.searchDialogLayout)
             self.searchEntry = qt.QLineEdit()
+            # query gbif once typing pauses rather than on every keystroke
+            self.searchTimer = qt.QTimer()
+            self.searchTimer.setSingleShot(True)
+            self.searchTimer.setInterval(250)
+            self.searchTimer.timeout.connect(self.onSearchTimeout)
             self.searchEntry.connect("textChanged(QString)", self.onSearchTextChanged)
             self.searchDialogLayout.addWidget(self.searchEntry)
             self.searchResults = qt.QListWidget()
@@ -2015,17 +2232,35 @@ class FormSpeciesQuestion(FormTextQuestion):
             self.searchDialog.move(mainWindow.geometry.center() - self.searchDialog.rect.center())
         self.searchEntry.text = self.answerText.text
         self.searchDialog.show()
+        # the dependency check only locates pygbif, so import it (and requests) once the
+        # dialog has painted rather than when the first search runs
+        qt.QTimer.singleShot(0, lambda: importlib.import_module("pygbif"))
 
     def onSearchTextChanged(self, text):
-        import pygbif
         self.searchResults.clear()
+        if len(text) < 3:
+            self.searchTimer.stop()
+            return
+        self.searchTimer.start()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def speciesSuggestions(text):
+        """gbif name suggestions for the search text, the most recent searches are shared for the session"""
+        # normally already imported when the search dialog opened
+        import pygbif
+        return tuple(pygbif.species.name_suggest(q=text, rank="species"))
+
+    def onSearchTimeout(self):
+        text = self.searchEntry.text
         if len(text) < 3:
             return
         try:
-            results = pygbif.species.name_suggest(q=text, rank="species")
+            results = self.speciesSuggestions(text)
         except Exception as e:
             slicer.util.errorDisplay(f"Error searching for species: {e}")
             return
+        self.searchResults.clear()
         for result in results:
             if result['rank'] == "SPECIES":
                 item = qt.QListWidgetItem(f"{result['canonicalName']} ({result['kingdom']})")
@@ -2153,6 +2388,15 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
 
     accessionFileFormatVersion = 2
 
+    # shared by all logic instances so connections can be reused across downloads
+    networkAccessManager = None
+    downloadBufferSize = 4 * 1024 * 1024
+    commandCheckLifetime = 300
+    dashboardDataLifetime = 10
+    morphoReposLifetime = 60
+    iDigBioRecordLifetime = 30 * 24 * 60 * 60
+    remoteURLRegex = re.compile(r'[:/]([^:/]+)/([^/]+?)(?:\.git)?/?$')
+
     def __init__(self, progressMethod = None) -> None:
         """Called when the logic class is instantiated. Can be used for initializing member variables."""
         ScriptedLoadableModuleLogic.__init__(self)
@@ -2160,31 +2404,58 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
         self.segmentationPath = None
         self.localRepo = None
         self.currentIssue = None
+        # remote name -> "owner/repo", valid only for nameWithOwnerRepo
+        self.nameWithOwnerByRemote = {}
+        self.nameWithOwnerRepo = None
+        # command tuple -> time it last succeeded, see checkCommand
+        self.commandCheckTimes = {}
+        # topic -> (time, (login, repository data)), see ghDashboardData
+        self.dashboardDataByTopic = {}
+        # (time, repository search results), see morphoRepos
+        self.morphoReposData = None
+        # keep-alive connection to the github api, see ghAPI
+        self.ghSession = None
+        # endpoint -> (etag, json) of GET responses, for conditional requests
+        self.ghResponseByEndpoint = {}
+        # active gh account, see whoami
+        self.ghLogin = None
         self.progressMethod = progressMethod if progressMethod else lambda *args : None
 
         # for Search
         self.repoDataByNameWithOwner = {}
+        self.searchTextByNameWithOwner = {}
 
         self.executableExtension = '.exe' if os.name == 'nt' else ''
         modulePath = os.path.split(slicer.modules.morphodepot.path)[0]
-        self.resourcesPath = os.path.normpath(modulePath + "/Resources")
-        self.pixiInstallDir = os.path.normpath(self.resourcesPath + "/pixi")
+        self.resourcesPath = os.path.join(modulePath, "Resources")
 
         # use configured git and gh paths if selected,
         # else use system installed git and gh if available
-        # Optionally install with pixi, but only if requireSystemGit is False
-        # note: normpath returns "." when given ""
-        gitPath = os.path.normpath(slicer.util.settingsValue("MorphoDepot/gitPath", "") or "")
-        ghPath = os.path.normpath(slicer.util.settingsValue("MorphoDepot/ghPath", "") or "")
-        if not gitPath or gitPath == "" or gitPath == ".":
-            gitPath = shutil.which("git") or ""
-        if not ghPath or ghPath == "" or ghPath == ".":
-            ghPath = shutil.which("gh") or ""
+        settings = qt.QSettings()
+        storedGitPath = settings.value("MorphoDepot/gitPath", "") or ""
+        storedGhPath = settings.value("MorphoDepot/ghPath", "") or ""
+        # which is only consulted when nothing is configured ("." is what normpath makes of "")
+        gitPath = storedGitPath if storedGitPath not in ("", ".") else shutil.which("git") or ""
+        ghPath = storedGhPath if storedGhPath not in ("", ".") else shutil.which("gh") or ""
+        # store normalized paths so callers can use them directly
+        gitPath = os.path.normpath(gitPath) if gitPath else ""
+        ghPath = os.path.normpath(ghPath) if ghPath else ""
         self.gitExecutablePath = gitPath
         self.ghExecutablePath = ghPath
+        # GitPython runs the git on the PATH (set up when it was imported) unless refreshed with another one
+        gitPythonExecutable = git.Git.GIT_PYTHON_GIT_EXECUTABLE
+        if gitPythonExecutable == "git":
+            gitPythonExecutable = os.path.normpath(shutil.which("git") or "git")
+        if gitPath and gitPath != gitPythonExecutable:
+            try:
+                git.refresh(path=gitPath)
+            except Exception as e:
+                logging.warning(f"GitPython could not use git at {gitPath}: {e}")
 
-        qt.QSettings().setValue("MorphoDepot/gitPath", self.gitExecutablePath)
-        qt.QSettings().setValue("MorphoDepot/ghPath", self.ghExecutablePath)
+        if gitPath != storedGitPath:
+            settings.setValue("MorphoDepot/gitPath", gitPath)
+        if ghPath != storedGhPath:
+            settings.setValue("MorphoDepot/ghPath", ghPath)
 
     def slicerVersionCheck(self):
         return hasattr(slicer.vtkSegment, "SetTerminology")
@@ -2197,6 +2468,78 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             return volumeRef  # existing repos with hardcoded URL — use as-is
         return f"https://github.com/{repoNameWithOwner}/{volumeRef}"
 
+    def downloadFile(self, url, filePath, checksum=None):
+        """Download url to filePath, writing bytes to disk as they arrive.
+        The reply signals drive a local event loop (user input excluded) instead of
+        blocking or polling, and the data goes to a .part file that is only renamed
+        into place once complete and, if a checksum like "SHA256:..." is given, verified.
+        A .part file left by an interrupted download is resumed with a range request;
+        http error responses are never written and discard the .part file.
+        """
+        if MorphoDepotLogic.networkAccessManager is None:
+            MorphoDepotLogic.networkAccessManager = qt.QNetworkAccessManager()
+        request = qt.QNetworkRequest(qt.QUrl(url))
+        request.setAttribute(qt.QNetworkRequest.RedirectPolicyAttribute, qt.QNetworkRequest.NoLessSafeRedirectPolicy)
+        request.setAttribute(qt.QNetworkRequest.HttpPipeliningAllowedAttribute, True)
+
+        partialPath = filePath + ".part"
+        resumeFrom = os.path.getsize(partialPath) if os.path.exists(partialPath) else 0
+        if resumeFrom:
+            request.setRawHeader("Range", f"bytes={resumeFrom}-")
+        outputFile = qt.QFile(partialPath)
+        if not outputFile.open(qt.QIODevice.Append if resumeFrom else qt.QIODevice.WriteOnly):
+            raise RuntimeError(f"Could not open {partialPath} for writing")
+
+        def statusCode():
+            return reply.attribute(qt.QNetworkRequest.HttpStatusCodeAttribute)
+
+        def onMetaDataChanged():
+            if resumeFrom and statusCode() == 200:
+                # the server sent the whole file rather than the requested range
+                outputFile.resize(0)
+
+        def onReadyRead():
+            # only success responses carry file data, error pages must not end up in the .part file
+            if statusCode() in (200, 206):
+                outputFile.write(reply.readAll())
+
+        if resumeFrom:
+            self.progressMethod(f"Resuming download of {url} after {resumeFrom} bytes")
+        else:
+            self.progressMethod(f"Downloading {url}")
+        reply = MorphoDepotLogic.networkAccessManager.get(request)
+        # bound what Qt buffers between readyRead signals so memory use
+        # does not grow with the size of the volume
+        reply.setReadBufferSize(self.downloadBufferSize)
+        loop = qt.QEventLoop()
+        reply.connect("metaDataChanged()", onMetaDataChanged)
+        reply.connect("readyRead()", onReadyRead)
+        reply.connect("finished()", loop.quit)
+        if not reply.isFinished():
+            loop.exec_(qt.QEventLoop.ExcludeUserInputEvents)
+        onReadyRead()
+        outputFile.close()
+        status = statusCode()
+        error = reply.error()
+        errorString = reply.errorString()
+        contentRange = bytes(reply.rawHeader("Content-Range").data()).decode()
+        reply.deleteLater()
+
+        # a refused range of exactly the .part size means an earlier attempt already got the whole file
+        alreadyComplete = status == 416 and resumeFrom and contentRange == f"bytes */{resumeFrom}"
+        if error != qt.QNetworkReply.NoError and not alreadyComplete:
+            # keep what arrived only if the transfer itself broke off, so the next attempt can resume
+            if status not in (200, 206, None) or not os.path.getsize(partialPath):
+                os.remove(partialPath)
+            raise RuntimeError(f"Download of {url} failed: {errorString}")
+        if checksum:
+            algo, digest = slicer.util.extractAlgoAndDigest(checksum)
+            if slicer.util.computeChecksum(algo, partialPath) != digest:
+                os.remove(partialPath)
+                raise ValueError(f"Checksum mismatch for {url}")
+        os.replace(partialPath, filePath)
+        return filePath
+
     def localRepositoryDirectory(self):
         repoDirectory = os.path.normpath(slicer.util.settingsValue("MorphoDepot/repoDirectory", "") or "")
         if repoDirectory == "" or repoDirectory == ".":
@@ -2221,37 +2564,46 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
     def checkPythonDependencies(self):
         """See if pygbif and idigbio are available.
         The GitPython package is installed by default in slicer.
+        Only looks the packages up, importing them is left to their users.
         """
-        try:
-            import pygbif
-        except ModuleNotFoundError:
-            return False
-
-        try:
-            import idigbio
-        except ModuleNotFoundError:
-            return False
-
-        return True
+        return all(importlib.util.find_spec(package) is not None for package in ("pygbif", "idigbio"))
 
     def installPythonDependencies(self):
         """Install pygbif and idigbio if needed
         """
-        try:
-            import pygbif
-        except ModuleNotFoundError:
-            self.progressMethod(f"Installing pygbif")
-            slicer.util.pip_install("pygbif")
+        missingPackages = [package for package in ("pygbif", "idigbio") if importlib.util.find_spec(package) is None]
+
+        if missingPackages:
+            # a single pip run resolves and downloads all of them together
+            self.progressMethod(f"Installing {' '.join(missingPackages)}")
+            slicer.util.pip_install(missingPackages)
             import pygbif
+            import idigbio
 
+    def gitExecutableWorks(self):
+        """True if the configured git runs.  Success is remembered in the settings for
+        the same executable file, so later sessions do not need to start git to know it"""
+        if not self.gitExecutablePath:
+            return False
         try:
-            import idigbio
-        except ModuleNotFoundError:
-            self.progressMethod(f"Installing idigbio")
-            slicer.util.pip_install("idigbio")
-            import idigbio
+            stat = os.stat(self.gitExecutablePath)
+        except OSError:
+            return False
+        signature = f"{self.gitExecutablePath}|{stat.st_mtime_ns}|{stat.st_size}"
+        if slicer.util.settingsValue("MorphoDepot/workingGitExecutable", "") == signature:
+            return True
+        if not self.checkCommand([self.gitExecutablePath, '--version']):
+            return False
+        qt.QSettings().setValue("MorphoDepot/workingGitExecutable", signature)
+        return True
 
     def checkCommand(self, command):
+        """Return True if command runs successfully.  Successes are remembered
+        for commandCheckLifetime seconds; failures are always rechecked"""
+        commandKey = tuple(command)
+        lastSuccess = self.commandCheckTimes.get(commandKey)
+        if lastSuccess is not None and time.monotonic() - lastSuccess < self.commandCheckLifetime:
+            return True
         try:
             completedProcess = subprocess.run(command, capture_output=True)
             returnCode = completedProcess.returncode
@@ -2266,6 +2618,7 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             self.progressMethod(stdout)
             self.progressMethod(stderr)
             return False
+        self.commandCheckTimes[commandKey] = time.monotonic()
         return True
 
     def checkGitDependencies(self):
@@ -2279,7 +2632,7 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             self.progressMethod(f"git path is {self.gitExecutablePath}")
             self.progressMethod(f"gh path is {self.ghExecutablePath}")
             return False
-        if not self.checkCommand([self.gitExecutablePath, '--version']):
+        if not self.gitExecutableWorks():
             return False
         if not self.checkCommand([self.ghExecutablePath, 'auth', 'status']):
             return False
@@ -2291,23 +2644,27 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
         if not self.ghExecutablePath or self.ghExecutablePath == "":
             logging.error("Error, gh not found")
             return "Error, gh not found"
-        if command.__class__() == "":
-            commandList = command.replace("\n", " ").split()
-        elif command.__class__() == []:
+        if isinstance(command, str):
+            commandList = command.split()
+        elif isinstance(command, list):
             commandList = command
         else:
             logging.error("command must be string or list")
+            raise TypeError("command must be string or list")
         self.progressMethod(" ".join(commandList))
         fullCommandList = [self.ghExecutablePath] + commandList
+        if commandList[:2] in (["auth", "login"], ["auth", "logout"], ["auth", "switch"], ["auth", "refresh"]):
+            # the active account or its token may change, so the api session and login are stale;
+            # read-only commands like auth status keep them
+            self.ghSession = None
+            self.ghResponseByEndpoint = {}
+            self.ghLogin = None
 
         baseDelay = 1
         attempts = 4
         for attempt in range(attempts):
-            originalLocale = locale.setlocale(locale.LC_ALL)
-            locale.setlocale(locale.LC_ALL, "en_US.UTF-8")
-            process = slicer.util.launchConsoleProcess(fullCommandList)
-            result = process.communicate()
-            locale.setlocale(locale.LC_ALL, originalLocale)
+            process = self.launchGhProcess(fullCommandList)
+            result = self.communicateWhileProcessingEvents(process)
             needRetry = result[0].find("error: 503") != -1
             if process.returncode == 0 or not needRetry:
                 if attempt > 0:
@@ -2326,6 +2683,39 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
         self.progressMethod(f"gh command finished: {result}")
         return result[0]
 
+    def launchGhProcess(self, commandList):
+        """Like slicer.util.launchConsoleProcess, but gh runs with a UTF-8 locale and its
+        output is decoded as UTF-8, without changing the locale of the Slicer process"""
+        environment = slicer.util.startupEnvironment()
+        environment.update({"LC_ALL": "en_US.UTF-8", "LANG": "en_US.UTF-8"})
+        startupinfo = None
+        if os.name == "nt":
+            # hide the console window
+            startupinfo = subprocess.STARTUPINFO()
+            startupinfo.dwFlags = subprocess.STARTF_USESHOWWINDOW
+            startupinfo.wShowWindow = 0
+        return subprocess.Popen(commandList, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                encoding="utf-8", errors="replace", env=environment, startupinfo=startupinfo)
+
+    def communicateWhileProcessingEvents(self, process, interval=0.1):
+        """Like process.communicate(), but keeps the application repainting
+        while waiting so long clones and forks do not freeze the window.
+        User input is held back so the current operation cannot be re-entered."""
+        while True:
+            try:
+                return process.communicate(timeout=interval)
+            except subprocess.TimeoutExpired:
+                slicer.app.processEvents(qt.QEventLoop.ExcludeUserInputEvents)
+
+    def resultWhileProcessingEvents(self, future, interval=0.1):
+        """Like future.result(), but keeps the application repainting while waiting,
+        see communicateWhileProcessingEvents"""
+        while True:
+            try:
+                return future.result(timeout=interval)
+            except concurrent.futures.TimeoutError:
+                slicer.app.processEvents(qt.QEventLoop.ExcludeUserInputEvents)
+
     def getGitConfig(self, key):
         """Get a value from the global git config."""
         if not self.gitExecutablePath:
@@ -2353,12 +2743,96 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             return json.loads(jsonString)
         return []
 
+    def ghAPI(self, method, endpoint, payload=None):
+        """Call the github REST api, e.g. ghAPI("POST", "repos/owner/repo/pulls/1/reviews", {...}).
+        Requests share one https connection authenticated with the token of the active gh account.
+        GET requests are conditional on the etag of the previous response, so unchanged
+        data is not resent and does not count against the rate limit"""
+        self.ensureGhSession()
+        self.progressMethod(f"{method} {endpoint}")
+        headers = {}
+        etag, cachedResult = self.ghResponseByEndpoint.get(endpoint, (None, None)) if method == "GET" else (None, None)
+        if etag:
+            headers["If-None-Match"] = etag
+        # the request runs on a worker thread so the window keeps repainting while github responds
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(self.ghSession.request, method, f"https://api.github.com/{endpoint}",
+                                     json=payload, headers=headers, timeout=60)
+            response = self.resultWhileProcessingEvents(future)
+        if response.status_code == 304:
+            return cachedResult
+        if not response.ok:
+            error_message = f"github api failed: {method} {endpoint}\nCode: {response.status_code}, Output: {response.text}"
+            logging.error(error_message)
+            self.progressMethod(f"github api error: {response.text}")
+            raise RuntimeError(error_message)
+        result = json.loads(response.content) if response.content else None
+        if method == "GET" and "ETag" in response.headers:
+            self.ghResponseByEndpoint[endpoint] = (response.headers["ETag"], result)
+        return result
+
+    def ghGraphQL(self, query, variables, paginate=False):
+        """Run a graphql query over the ghAPI session and return the list of result pages,
+        like gh api graphql --paginate --slurp.  Paginated queries take an $endCursor
+        variable and request pageInfo { endCursor hasNextPage }"""
+        pages = []
+        variables = dict(variables)
+        while True:
+            page = self.ghAPI("POST", "graphql", {"query": query, "variables": variables})
+            if page.get("errors"):
+                error_message = f"github graphql query failed: {page['errors']}"
+                logging.error(error_message)
+                raise RuntimeError(error_message)
+            pages.append(page)
+            pageInfo = self.findPageInfo(page["data"]) if paginate else None
+            if not pageInfo or not pageInfo["hasNextPage"]:
+                return pages
+            variables["endCursor"] = pageInfo["endCursor"]
+
+    @staticmethod
+    def findPageInfo(data):
+        """The first pageInfo in a graphql result, searched depth first"""
+        if isinstance(data, dict):
+            if "pageInfo" in data:
+                return data["pageInfo"]
+            for value in data.values():
+                pageInfo = MorphoDepotLogic.findPageInfo(value)
+                if pageInfo:
+                    return pageInfo
+        return None
+
+    def ensureGhSession(self):
+        if self.ghSession is None:
+            # not via self.gh so the token is not echoed to the progress output
+            process = self.launchGhProcess([self.ghExecutablePath, "auth", "token"])
+            token = self.communicateWhileProcessingEvents(process)[0].strip()
+            if process.returncode != 0:
+                raise RuntimeError("gh could not provide an authentication token")
+            retry = requests.adapters.Retry(total=3, backoff_factor=1, status_forcelist=[503], allowed_methods=None)
+            self.ghSession = requests.Session()
+            self.ghSession.mount("https://", requests.adapters.HTTPAdapter(max_retries=retry))
+            self.ghSession.headers.update({
+                "Authorization": f"token {token}",
+                "Accept": "application/vnd.github+json",
+            })
+
     def ghTopicClearCache(self):
-        self.gh("config clear-cache")
+        self.dashboardDataByTopic = {}
+        self.morphoReposData = None
 
     def ghTopicData(self, topic="MorphoDepot"):
+        return self.ghDashboardData(topic)[1]
+
+    def ghDashboardData(self, topic="MorphoDepot"):
+        """Return the active login and the repositories with the topic,
+        fetched together in one graphql query.  The result is reused for
+        dashboardDataLifetime seconds or until ghTopicClearCache is called"""
+        timestamp, dashboardData = self.dashboardDataByTopic.get(topic, (None, None))
+        if timestamp is not None and time.monotonic() - timestamp < self.dashboardDataLifetime:
+            return dashboardData
         query="""
             query($params: String!, $endCursor: String) {
+                viewer { login }
                 search(query: $params, type: REPOSITORY, first: 100, after: $endCursor) {
                     nodes {
                         ... on Repository {
@@ -2386,13 +2860,18 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             }
         """
         params = f"topic:{topic} fork:true"
-        command = ['api', 'graphql', "--cache", "10m", '--paginate', '--slurp',
-                   '-f', f'query={query}', '-f', f'params={params}']
-        searchData = self.ghJSON(command)
-        return searchData[0]['data']['search']['nodes']
+        pages = self.ghGraphQL(query, {"params": params}, paginate=True)
+        me = pages[0]['data']['viewer']['login']
+        repoData = [node for page in pages for node in page['data']['search']['nodes'] if node]
+        self.dashboardDataByTopic[topic] = (time.monotonic(), (me, repoData))
+        return me, repoData
 
     def morphoRepos(self):
         # TODO: generalize for other topics
+        if self.morphoReposData:
+            fetchTime, repos = self.morphoReposData
+            if time.monotonic() - fetchTime < self.morphoReposLifetime:
+                return repos
         query = """
             query($searchQuery: String!, $endCursor: String) {
               search(query: $searchQuery, type: REPOSITORY, first: 100, after: $endCursor) {
@@ -2426,20 +2905,26 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             }
         """
         search_query_string = "topic:morphodepot fork:true"
-        command = ['api', 'graphql', '--paginate', '--slurp',
-                   '-f', f'query={query}', '-f', f'searchQuery={search_query_string}']
-        pages = self.ghJSON(command)
+        # cached like ghTopicData; ghTopicClearCache drops it after repository changes
+        pages = self.ghGraphQL(query, {"searchQuery": search_query_string}, paginate=True)
         all_repos = [repo for page in pages for repo in page['data']['search']['nodes'] if repo]
 
+        self.morphoReposData = (time.monotonic(), all_repos)
         return all_repos
 
     def whoami(self):
         """ Get the active gh account """
-        return(self.gh("auth status --active").split()[7])
-
-    def issueList(self):
-        me = self.whoami()
-        repoData = self.ghTopicData()
+        if self.ghLogin is None:
+            self.ghLogin = self.gh("auth status --active").split()[7]
+        return self.ghLogin
+
+    def issueList(self, me=None, repoData=None):
+        """Open issues assigned to the user.  Pass `me` and `repoData` to reuse
+        already fetched account and topic data"""
+        if repoData is None:
+            viewer, repoData = self.ghDashboardData()
+            me = me if me else viewer
+        me = me if me else self.whoami()
         issueList = []
         for repo in repoData:
             for issue in repo['issues']['nodes']:
@@ -2459,13 +2944,16 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
                 returnRepos.append(repo)
         return returnRepos
 
-    def prList(self, role="segmenter"):
+    def prList(self, role="segmenter", me=None, repoData=None):
         """
         Fetch a list of open pull requests for the user, either as 'segmenter' or reviewer.
         Returns PRs, their associated issue titles, and repository topics.
+        Pass `me` and `repoData` to reuse already fetched account and topic data.
         """
-        me = self.whoami()
-        repoData = self.ghTopicData()
+        if repoData is None:
+            viewer, repoData = self.ghDashboardData()
+            me = me if me else viewer
+        me = me if me else self.whoami()
         prList = []
         for repo in repoData:
             for pr in repo['pullRequests']['nodes']:
@@ -2487,15 +2975,11 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
         return prList
 
 
-    def repositoryList(self):
-        repositories = json.loads(self.gh("repo list --json name"))
-        repositoryList = [r['name'] for r in repositories]
-        return repositoryList
-
     def ensureUpstreamExists(self):
         if not "upstream" in self.localRepo.remotes:
             # no upstream, so this is an issue assigned to the owner of the repo
-            self.localRepo.create_remote("upstream", list(self.localRepo.remotes[0].urls)[0])
+            # remote.url reads the repository config; remote.urls runs git remote get-url
+            self.localRepo.create_remote("upstream", self.localRepo.remotes[0].url)
 
     def loadIssue(self, issue, repoDirectory):
         self.currentIssue = issue
@@ -2508,31 +2992,29 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
 
         self.cacheOldVersion(localDirectory)
 
-        if repositoryName not in self.repositoryList():
-            self.gh(f"repo fork {sourceRepository} --clone=false")
-        self.gh(f"repo clone {repositoryName} {localDirectory}")
+        # gh repo fork only reports an already existing fork, so no repository listing is needed;
+        # issues in the user's own repositories are worked on directly
+        if sourceRepository.split("/")[0] != self.whoami():
+            self.gh(["repo", "fork", sourceRepository, "--clone=false"])
+        # only the tip of main is cloned; older .seg.nrrd revisions and other issues' branches stay on github
+        self.gh(["repo", "clone", repositoryName, localDirectory, "--", "--depth", "1"])
         self.localRepo = git.Repo(localDirectory)
+        # keep tracking refs for any branch pushed or pulled later, as a full clone would
+        self.localRepo.git.remote("set-branches", "origin", "*")
         self.ensureUpstreamExists()
 
-        originBranches = self.localRepo.remotes.origin.fetch()
-        originBranchIDs = [ob.name for ob in originBranches]
+        # ls-remote asks for the branch without downloading any objects
         originBranchID = f"origin/{branchName}"
 
-        localIssueBranch = None
-        for branch in self.localRepo.branches:
-            if branch.name == branchName:
-                localIssueBranch = branch
-                break
-
         logging.debug("Making new branch")
-        if originBranchID in originBranchIDs:
+        if self.localRepo.git.ls_remote("--heads", "origin", branchName):
             logging.debug("Checking out existing from origin")
-            self.localRepo.git.execute(f"git checkout --track {originBranchID}".split())
+            self.localRepo.git.fetch("--depth", "1", "origin", branchName)
+            self.localRepo.git.checkout("--track", originBranchID)
         else:
             logging.debug("Nothing local or remote, nothing in origin so make new branch %s", branchName)
-            self.localRepo.git.checkout("origin/main")
-            self.localRepo.git.branch(branchName)
-            self.localRepo.git.checkout(branchName)
+            # one checkout creates the branch at origin/main, untracked like a plain git branch
+            self.localRepo.git.checkout("--no-track", "-b", branchName, "origin/main")
 
         self.loadFromLocalRepository()
 
@@ -2544,11 +3026,11 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
 
         self.cacheOldVersion(localDirectory)
 
-        self.gh(f"repo clone {repoNameWithOwner} {localDirectory}")
+        # the clone fetches every branch of origin and checks out the PR branch directly
+        self.gh(["repo", "clone", repoNameWithOwner, localDirectory, "--",
+                 "--depth", "1", "--no-single-branch", "--branch", branchName])
         self.localRepo = git.Repo(localDirectory)
         self.ensureUpstreamExists()
-        self.localRepo.remotes.origin.fetch()
-        self.localRepo.git.checkout(branchName)
 
         self.loadFromLocalRepository(configuration="reviewer")
         return True
@@ -2560,11 +3042,10 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
 
         self.cacheOldVersion(localDirectory)
 
-        # clone the main repo, not a fork
-        self.gh(f"repo clone {repoNameWithOwner} {localDirectory}")
+        # clone the main repo, not a fork, with only the tip of main checked out
+        self.gh(["repo", "clone", repoNameWithOwner, localDirectory, "--", "--depth", "1", "--branch", "main"])
 
         self.localRepo = git.Repo(localDirectory)
-        self.localRepo.git.checkout("main")
         self.loadFromLocalRepository(remoteName="origin", configuration="release")
         return True
 
@@ -2574,10 +3055,10 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
 
         self.cacheOldVersion(localDirectory)
 
-        self.gh(f"repo clone {repoNameWithOwner} {localDirectory}")
+        # previews are read only, so the tip of main is all that is needed
+        self.gh(["repo", "clone", repoNameWithOwner, localDirectory, "--", "--depth", "1", "--branch", "main"])
 
         self.localRepo = git.Repo(localDirectory)
-        self.localRepo.git.checkout("main")
         self.loadFromLocalRepository(remoteName="origin", configuration="preview")
         return True
 
@@ -2588,22 +3069,30 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
 
         self.progressMethod(f"Loading {branchName} into {localDirectory}")
 
+        # sort the repository files by type in a single directory scan
+        csvPaths, ctblPaths, segmentationPaths = [], [], []
+        with os.scandir(localDirectory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".seg.nrrd"):
+                    segmentationPaths.append(entry.path)
+                elif entry.name.endswith(".csv"):
+                    csvPaths.append(entry.path)
+                elif entry.name.endswith(".ctbl"):
+                    ctblPaths.append(entry.path)
+
         self.colorTableNode = None
-        try:
-            colorPath = glob.glob(f"{localDirectory}/*.csv")[0]
-            self.colorTableNode = slicer.util.loadColorTable(colorPath)
-        except IndexError:
-            try:
-                colorPath = glob.glob(f"{localDirectory}/*.ctbl")[0]
-                self.colorTableNode = slicer.util.loadColorTable(colorPath)
-            except IndexError:
-                self.ghProgressMethod(f"No color table found")
+        colorPaths = csvPaths or ctblPaths
+        if colorPaths:
+            self.colorTableNode = slicer.util.loadColorTable(colorPaths[0])
+        else:
+            self.progressMethod(f"No color table found")
 
         # TODO: move from single volume file to segmentation specification json
         volumePath = os.path.join(localDirectory, "source_volume")
         if not os.path.exists(volumePath):
             volumePath = os.path.join(localDirectory, "master_volume") # for backwards compatibility
-        volumeRef = open(volumePath).read().strip()
+        with open(volumePath) as fp:
+            volumeRef = fp.read().strip()
         # The source_volume pointer is "releases/download/v1/{originalName}.nrrd";
         # remember the original name so the UI can display it.
         self.sourceVolumeName = os.path.basename(volumeRef).rsplit('.nrrd', 1)[0]
@@ -2617,14 +3106,19 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             with open(checksumFilePath) as fp:
                 checksum = fp.read().strip()
         if not os.path.exists(nrrdPath):
-            slicer.util.downloadFile(volumeURL, nrrdPath, checksum=checksum)
+            self.downloadFile(volumeURL, nrrdPath, checksum=checksum)
         volumeNode = slicer.util.loadVolume(nrrdPath)
 
-        # Load all segmentations
+        # Load all segmentations, rendering once at the end rather than after each one
+        hideSegmentations = configuration in ("segment", "reviewer")
         segmentationNodesByName = {}
-        for segmentationPath in glob.glob(f"{localDirectory}/*.seg.nrrd"):
-            name = os.path.split(segmentationPath)[1].split(".")[0]
-            segmentationNodesByName[name] = slicer.util.loadSegmentation(segmentationPath)
+        with slicer.util.RenderBlocker():
+            for segmentationPath in segmentationPaths:
+                name = os.path.split(segmentationPath)[1].split(".")[0]
+                segmentationNode = slicer.util.loadSegmentation(segmentationPath)
+                if hideSegmentations:
+                    segmentationNode.GetDisplayNode().SetVisibility(False)
+                segmentationNodesByName[name] = segmentationNode
         # Default for the New release "baseline segmentation" picker: prefer a segmentation
         # named "baseline" if present, otherwise fall back to whatever loaded.
         self.baselineSegmentationNode = (
@@ -2633,9 +3127,6 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
         )
 
         if configuration in ("segment", "reviewer"):
-            for segmentationNode in segmentationNodesByName.values():
-                segmentationNode.GetDisplayNode().SetVisibility(False)
-
             # Switch to Segment Editor module
             pluginHandlerSingleton = slicer.qSlicerSubjectHierarchyPluginHandler.instance()
             pluginHandlerSingleton.pluginByName("Default").switchToModule("SegmentEditor")
@@ -2660,26 +3151,20 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             editorWidget.parameterSetNode.SetAndObserveSourceVolumeNode(volumeNode)
 
     def nameWithOwner(self, remote):
-        branchName = self.localRepo.active_branch.name
-        repo = self.localRepo.remote(name=remote)
-        repoURL = list(repo.urls)[0]
-        if repoURL.find("@") != -1:
-            # git ssh prototocol
-            repoURL = "/".join(repoURL.split(":"))
-            repoNameWithOwner = "/".join(repoURL.split("/")[-2:]).split(".")[0]
-        elif repoURL.startswith("https://"):
-            # https protocol
-            repoNameWithOwner = "/".join(repoURL.split("/")[-2:]).split(".")[0]
-        elif repoURL.startswith("git@"):
-            # git@github.com:owner/repo.git
-            repoNameWithOwner = repoURL.split(":")[1].replace(".git", "")
-        elif os.path.exists(repoURL):
+        if self.nameWithOwnerRepo is not self.localRepo:
+            self.nameWithOwnerByRemote = {}
+            self.nameWithOwnerRepo = self.localRepo
+        if remote in self.nameWithOwnerByRemote:
+            return self.nameWithOwnerByRemote[remote]
+        repoURL = self.localRepo.remote(name=remote).url
+        if "@" not in repoURL and not repoURL.startswith("https://") and os.path.exists(repoURL):
             # local path
             # this case happens during repo creation before pushing to remote
             return None
-        else:
-            # https protocol
-            repoNameWithOwner = "/".join(repoURL.split("/")[-2:]).split(".")[0]
+        # handles https://github.com/owner/repo(.git) and git@github.com:owner/repo(.git)
+        match = self.remoteURLRegex.search(repoURL)
+        repoNameWithOwner = f"{match.group(1)}/{match.group(2)}" if match else None
+        self.nameWithOwnerByRemote[remote] = repoNameWithOwner
         return repoNameWithOwner
 
     def issuePR(self, role="segmenter"):
@@ -2693,13 +3178,37 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             upstreamNameWithOwner = self.nameWithOwner("upstream")
         except ValueError:
             return None
-        issuePR = None
-        prs = self.prList(role=role)
+        return self.prForBranch(upstreamNameWithOwner, branchName, role)
+
+    def prForBranch(self, repoNameWithOwner, branchName, role="segmenter"):
+        """The open pull request for branchName in repoNameWithOwner visible to the user in the given role, or None.
+        Github filters by head branch, so this does not depend on the full prList"""
+        prs = self.ghJSON(self.prForBranchCommand(repoNameWithOwner, branchName))
+        return self.selectBranchPR(prs, repoNameWithOwner, branchName, role)
+
+    @staticmethod
+    def prForBranchCommand(repoNameWithOwner, branchName):
+        return ["pr", "list", "--repo", repoNameWithOwner, "--head", branchName,
+                "--state", "open", "--json", "id,number,title,isDraft,author"]
+
+    def selectBranchPR(self, prs, repoNameWithOwner, branchName, role="segmenter"):
+        """Pick the pull request for the user in the given role from the output of prForBranchCommand"""
+        me = self.whoami()
         for pr in prs:
-            prRepoNameWithOwner = pr['repository']['nameWithOwner']
-            if prRepoNameWithOwner == upstreamNameWithOwner and pr['title'] == branchName:
-                issuePR = pr
-        return issuePR
+            if pr['title'] != branchName:
+                continue
+            if role == "segmenter":
+                parties = [pr['author']['login']]
+            else:
+                parties = [repoNameWithOwner.split("/")[0]]
+            if me in parties:
+                return {'id': pr['id'],
+                        'number': pr['number'],
+                        'title': pr['title'],
+                        'isDraft': pr['isDraft'],
+                        'author': {'login': pr['author']['login']},
+                        'repository': {'name': repoNameWithOwner.split("/")[1], 'nameWithOwner': repoNameWithOwner}}
+        return None
 
     def cacheOldVersion(self, directoryPath):
         """If directoryPath exists, move it to an archive in the cache."""
@@ -2721,48 +3230,70 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
         if not slicer.util.saveNode(self.segmentationNode, self.segmentationPath, properties={'useCompression': True}):
             logging.error(f"Segmentation save failed: path is {self.segmentationPath}")
             return False
-        self.localRepo.index.add([self.segmentationPath])
-        self.localRepo.index.commit(message)
+        # the git executable streams large segmentation files rather than hashing them in python
+        self.localRepo.git.add("--", self.segmentationPath)
+        if self.localRepo.head.is_valid() and not self.localRepo.is_dirty(index=True, working_tree=False, path=self.segmentationPath):
+            # saved file is identical to the last commit; just make sure it is pushed
+            self.progressMethod("Segmentation unchanged since last commit")
+        else:
+            self.localRepo.git.commit("-m", message, "--", self.segmentationPath)
 
         branchName = self.localRepo.active_branch.name
-        remote = self.localRepo.remote(name="origin")
-
-        # rebase branch if it exists in case other changes have been made (e.g. on another machine)
-        branchNames = [branch.name.split("/")[1] for branch in self.localRepo.remotes['origin'].refs]
-        if branchName in branchNames:
-            pullResult = self.localRepo.git.pull(f"--rebase", "origin", branchName)
-            self.progressMethod(pullResult)
-
-        # Workaround for missing origin.push().raise_if_error() in 3.1.14
-        # (see https://github.com/gitpython-developers/GitPython/issues/621):
-        # https://github.com/gitpython-developers/GitPython/issues/621
-        pushInfoList = remote.push(branchName)
-        for pi in pushInfoList:
-            for flag in [pi.REJECTED, pi.REMOTE_REJECTED, pi.REMOTE_FAILURE, pi.ERROR]:
-                if pi.flags & flag:
-                    self.progressMethod(f"Push failed with {flag}")
-                    return False
+
+        # whether the PR exists does not depend on the push, so look it up while pushing
+        upstreamNameWithOwner = self.nameWithOwner("upstream")
+        prCommandList = self.prForBranchCommand(upstreamNameWithOwner, branchName)
+        self.progressMethod(" ".join(prCommandList))
+        prProcess = self.launchGhProcess([self.ghExecutablePath] + prCommandList)
+
+        pushed = False
+        try:
+            # rebase branch if it exists in case other changes have been made (e.g. on another machine)
+            branchNames = [branch.name.split("/")[1] for branch in self.localRepo.remotes['origin'].refs]
+            if branchName in branchNames:
+                pullResult = self.localRepo.git.pull(f"--rebase", "origin", branchName)
+                self.progressMethod(pullResult)
+
+            # porcelain output has one line per ref, rejected refs are flagged with "!"
+            try:
+                pushResult = self.localRepo.git.push("--porcelain", "origin", branchName)
+            except git.exc.GitCommandError as pushError:
+                logging.error(f"Push failed: {pushError.stderr}")
+                self.progressMethod(f"Push failed: {pushError.stdout} {pushError.stderr}")
+                return False
+            if any(line.startswith("!") for line in pushResult.splitlines()):
+                self.progressMethod(f"Push failed: {pushResult}")
+                return False
+            pushed = True
+        finally:
+            if not pushed:
+                prProcess.kill()
+                prProcess.communicate()
+
+        prResult = self.communicateWhileProcessingEvents(prProcess)
+        if prProcess.returncode == 0:
+            prs = json.loads(prResult[0]) if prResult[0].strip() else []
+            pr = self.selectBranchPR(prs, upstreamNameWithOwner, branchName)
+        else:
+            self.progressMethod(f"gh command error: {prResult}")
+            pr = self.issuePR()
 
         # create a PR if needed
-        if not self.issuePR():
+        if not pr:
             issueNumber = branchName.split("-")[1]
-            upstreamNameWithOwner = self.nameWithOwner("upstream")
             originNameWithOwner = self.nameWithOwner("origin")
             originOwner = originNameWithOwner.split("/")[0]
             prBody = f"Fixes #{issueNumber}"
             if self.currentIssue and 'author' in self.currentIssue and 'login' in self.currentIssue['author']:
                 authorLogin = self.currentIssue['author']['login']
                 prBody = f"Started work on this issue for @{authorLogin}. {prBody}"
-            commandList = f"""
-                pr create
-                --draft
-                --repo {upstreamNameWithOwner}
-                --base main
-                --title {branchName}
-                --head {originOwner}:{branchName}
-            """.replace("\n"," ").split()
-            commandList += ["--body", prBody]
-            self.gh(commandList)
+            self.ghAPI("POST", f"repos/{upstreamNameWithOwner}/pulls", {
+                "title": branchName,
+                "head": f"{originOwner}:{branchName}",
+                "base": "main",
+                "body": prBody,
+                "draft": True,
+            })
             self.ghTopicClearCache()
         return True
 
@@ -2772,67 +3303,75 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             logging.error("No pull request found for the current issue branch.")
             return
 
-        upstreamNameWithOwner = self.nameWithOwner("upstream")
-        self.gh(f"""
-            pr ready {pr['number']}
-                --repo {upstreamNameWithOwner}
-            """)
+        mutation = """
+            mutation($pullRequestId: ID!) {
+              markPullRequestReadyForReview(input: {pullRequestId: $pullRequestId}) { clientMutationId }
+            }
+        """
+        self.ghGraphQL(mutation, {"pullRequestId": pr['id']})
         self.ghTopicClearCache()
 
     def requestChanges(self, message=""):
         pr = self.issuePR(role="reviewer")
-        upstreamNameWithOwner = self.nameWithOwner("upstream")
-        commandList = f"""
-            pr review {pr['number']}
-                --request-changes
-                --repo {upstreamNameWithOwner}
-        """.replace("\n"," ").split()
-        if message != "":
-            commandList += ["--body", message]
-        self.gh(commandList)
-        self.gh(f"""
-            pr ready {pr['number']}
-                --undo
-                --repo {upstreamNameWithOwner}
-            """)
-        self.ghTopicClearCache()
+        # separate requests, so a rejected review leaves the PR ready for review
+        mutation = """
+            mutation($pullRequestId: ID!) {
+              convertPullRequestToDraft(input: {pullRequestId: $pullRequestId}) { clientMutationId }
+            }
+        """
+        try:
+            self.reviewPR(pr, "REQUEST_CHANGES", message)
+            self.ghGraphQL(mutation, {"pullRequestId": pr['id']})
+        finally:
+            self.ghTopicClearCache()
 
     def approvePR(self, message=""):
         pr = self.issuePR(role="reviewer")
-        upstreamNameWithOwner = self.nameWithOwner("upstream")
         # TODO: this if the reviewer is also the creator of the PR
         # this generates an error from github that you aren't allowed
         # to approve your own PRs, but it's just a warning in this case.
         # Checking the name to avoid the approval or just skipping
         # approval since we are closing the PR anyway would be fine.
-        commandList = f"""
-            pr review {pr['number']}
-                --approve
-                --repo {upstreamNameWithOwner}
-        """.replace("\n"," ").split()
-        if message != "":
-            commandList += ["--body", message]
-        self.gh(commandList)
-        commandList = f"""
-            pr merge {pr['number']}
-                --repo {upstreamNameWithOwner}
-                --squash
-        """.replace("\n"," ").split()
-        commandList += ["--body", "Merging and closing"]
-        self.gh(commandList)
-        self.ghTopicClearCache()
+
+        # separate requests, so a rejected review does not merge the PR
+        mutation = """
+            mutation($pullRequestId: ID!) {
+              mergePullRequest(input: {pullRequestId: $pullRequestId, mergeMethod: SQUASH, commitBody: "Merging and closing"}) { clientMutationId }
+            }
+        """
+        try:
+            self.reviewPR(pr, "APPROVE", message)
+            self.ghGraphQL(mutation, {"pullRequestId": pr['id']})
+        finally:
+            self.ghTopicClearCache()
+
+    def reviewPR(self, pr, event, message=""):
+        """Submit a review of the pull request, event is APPROVE or REQUEST_CHANGES"""
+        mutation = """
+            mutation($pullRequestId: ID!, $event: PullRequestReviewEvent!, $body: String) {
+              addPullRequestReview(input: {pullRequestId: $pullRequestId, event: $event, body: $body}) { clientMutationId }
+            }
+        """
+        self.ghGraphQL(mutation, {"pullRequestId": pr['id'], "event": event, "body": message or None})
 
     def getReleases(self):
         """Get list of releases for the current repository (latest first)."""
         if not self.localRepo:
             return None
         originNameWithOwner = self.nameWithOwner("origin")
-        return self.ghJSON(f"release list --repo {originNameWithOwner} --json name,tagName,publishedAt")
+        return self.releaseList(originNameWithOwner)
+
+    def releaseList(self, nameWithOwner):
+        """Releases of the repository, latest first, each with name, tagName and publishedAt"""
+        releases = self.ghAPI("GET", f"repos/{nameWithOwner}/releases?per_page=100") or []
+        return [{'name': release['name'],
+                 'tagName': release['tag_name'],
+                 'publishedAt': release['published_at']} for release in releases]
 
     def closedIssuesSinceLastRelease(self, nameWithOwner):
         """Return a list of {number,title} for issues closed since the last published release.
         If there is no prior release, returns all closed issues for the repo."""
-        releases = self.ghJSON(f"release list --repo {nameWithOwner} --json tagName,publishedAt") or []
+        releases = self.releaseList(nameWithOwner)
         sinceDate = releases[0].get('publishedAt') if releases else None
         if sinceDate:
             cmd = ["issue", "list", "--repo", nameWithOwner,
@@ -2987,14 +3526,23 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
         repoDir = self.localRepo.working_dir
         previousTag = self.previousReleaseTag()
 
+        # sort the repository files by type in a single directory scan
+        csvPaths, ctblPaths, issueSegmentationPaths = [], [], []
+        with os.scandir(repoDir) as entries:
+            for entry in entries:
+                if entry.name.startswith("issue-") and entry.name.endswith(".seg.nrrd"):
+                    issueSegmentationPaths.append(entry.path)
+                elif entry.name.endswith(".csv"):
+                    csvPaths.append(entry.path)
+                elif entry.name.endswith(".ctbl"):
+                    ctblPaths.append(entry.path)
+
         # Baseline segmentation
         baselinePath = os.path.join(repoDir, "baseline.seg.nrrd")
         if not slicer.util.saveNode(baselineNode, baselinePath, properties={'useCompression': True}):
             raise RuntimeError(f"Failed to save baseline segmentation to {baselinePath}")
 
         # Color table — overwrite the existing repo color file (.csv preferred over .ctbl).
-        csvPaths = glob.glob(f"{repoDir}/*.csv")
-        ctblPaths = glob.glob(f"{repoDir}/*.ctbl")
         if csvPaths:
             colorTablePath = csvPaths[0]
         elif ctblPaths:
@@ -3034,12 +3582,12 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
             f.write(self.generateReleaseReadme(newTag, newScreenshotEntries))
 
         # Drop per-issue segmentations from the working tree (kept in history)
-        for path in glob.glob(os.path.join(repoDir, "issue-*.seg.nrrd")):
+        for path in issueSegmentationPaths:
             os.remove(path)
 
         # Stage everything (added, modified, deleted), commit, push.
         self.localRepo.git.add("--all")
-        self.localRepo.index.commit(f"Prepare release {newTag}")
+        self.localRepo.git.commit("-m", f"Prepare release {newTag}")
         self.localRepo.remote(name="origin").push("main")
 
     def resetToReleaseBackup(self):
@@ -3088,22 +3636,32 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
         originNameWithOwner = self.nameWithOwner("origin")
         if releaseNotes == "":
             releaseNotes = f"Version {tag} release."
-        commandList = ["release", "create", tag, "--repo", originNameWithOwner]
-        commandList += ["--notes", releaseNotes]
-        self.gh(commandList)
+        self.ghAPI("POST", f"repos/{originNameWithOwner}/releases",
+                   {"tag_name": tag, "name": tag, "body": releaseNotes})
         return tag
 
     def openIssuesAndPRs(self, nameWithOwner):
         """Return (issues, prs) lists of open items for the given repo, each with number and title."""
-        issues = self.ghJSON(f"issue list --repo {nameWithOwner} --state open --json number,title")
-        prs = self.ghJSON(f"pr list --repo {nameWithOwner} --state open --json number,title")
-        return issues, prs
+        # one graphql round trip instead of separate issue and pr list commands
+        query = """
+            query($owner: String!, $name: String!) {
+              repository(owner: $owner, name: $name) {
+                issues(states: [OPEN], first: 100) { nodes { number title } }
+                pullRequests(states: [OPEN], first: 100) { nodes { number title } }
+              }
+            }
+        """
+        owner, name = nameWithOwner.split("/")
+        result = self.ghGraphQL(query, {"owner": owner, "name": name})[0]
+        repository = result['data']['repository']
+        return repository['issues']['nodes'], repository['pullRequests']['nodes']
 
     def announceUpcomingRelease(self, nameWithOwner, deadlineISO, message):
         """Post a release-announcement comment on every open issue and PR.
         Substitutes {deadline} in the message body. Returns (issueCount, prCount)."""
         issues, prs = self.openIssuesAndPRs(nameWithOwner)
         body = message.replace("{deadline}", deadlineISO)
+        # comments are posted one at a time, as github asks for content-creating requests
         for issue in issues:
             n = str(issue['number'])
             self.progressMethod(f"Announcement on issue #{n}: {issue['title']}")
@@ -3123,76 +3681,128 @@ class MorphoDepotLogic(ScriptedLoadableModuleLogic):
                 f"Open a new issue or PR on the updated baseline to continue contributing."
             )
         issues, prs = self.openIssuesAndPRs(nameWithOwner)
+        # one at a time, but close --comment posts the comment and closes in one gh call
         for issue in issues:
             n = str(issue['number'])
             self.progressMethod(f"Closing issue #{n}: {issue['title']}")
-            self.gh(["issue", "comment", n, "--repo", nameWithOwner, "--body", message])
-            self.gh(["issue", "close", n, "--repo", nameWithOwner])
+            self.gh(["issue", "close", n, "--repo", nameWithOwner, "--comment", message])
         for pr in prs:
             n = str(pr['number'])
             self.progressMethod(f"Closing PR #{n}: {pr['title']}")
-            self.gh(["pr", "comment", n, "--repo", nameWithOwner, "--body", message])
-            self.gh(["pr", "close", n, "--repo", nameWithOwner])
+            self.gh(["pr", "close", n, "--repo", nameWithOwner, "--comment", message])
         return len(issues), len(prs)
 
+    def cachedLicensePath(self, licenseURL, cacheDirectory):
+        """Path to a local copy of the license text in cacheDirectory, downloaded the first time it is needed.
+        Only uses requests and file I/O, so it can run on a worker thread"""
+        licensePath = os.path.join(cacheDirectory, licenseURL.split("/")[-2] + "-" + os.path.basename(licenseURL))
+        if not os.path.exists(licensePath):
+            os.makedirs(cacheDirectory, exist_ok=True)
+            # streamed to a .part file so an interrupted download is not cached
+            partialPath = licensePath + ".part"
+            try:
+                with requests.get(licenseURL, stream=True, timeout=60) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    with open(partialPath, "wb") as fp:
+                        shutil.copyfileobj(response.raw, fp)
+            except Exception:
+                if os.path.exists(partialPath):
+                    os.remove(partialPath)
+                raise
+            os.replace(partialPath, licensePath)
+        return licensePath
+
+    def iDigBioRecord(self, specimenID, cacheDirectory):
+        """The iDigBio record of the specimen, cached in cacheDirectory since records rarely change"""
+        recordPath = os.path.join(cacheDirectory, os.path.basename(specimenID) + ".json")
+        if os.path.exists(recordPath) and time.time() - os.path.getmtime(recordPath) < self.iDigBioRecordLifetime:
+            with open(recordPath) as fp:
+                return json.load(fp)
+        import idigbio
+        api = idigbio.json()
+        idigbioData = api.view("records", specimenID)
+        os.makedirs(cacheDirectory, exist_ok=True)
+        partialPath = recordPath + ".part"
+        try:
+            with open(partialPath, "w") as fp:
+                json.dump(idigbioData, fp)
+        except Exception:
+            if os.path.exists(partialPath):
+                os.remove(partialPath)
+            raise
+        os.replace(partialPath, recordPath)
+        return idigbioData
+
+    def accessionSpecies(self, accessionData, iDigBioCacheDirectory):
+        """Species name for the accession, looked up from iDigBio when the specimen is accessioned there.
+        Only uses the network and file I/O, so it can run on a worker thread"""
+        if accessionData['iDigBioAccessioned'][1] != "Yes":
+            return accessionData['species'][1]
+        idigbioURL = accessionData['iDigBioURL'][1]
+        specimenID = idigbioURL.split("/")[-1]
+        idigbioData = self.iDigBioRecord(specimenID, iDigBioCacheDirectory)
+        if 'ala:species' in idigbioData['data']:
+            return idigbioData['data']['ala:species']
+        if 'dwc:scientificName' in idigbioData['data']:
+            return idigbioData['data']['dwc:scientificName']
+        logging.warning(f"Could not find species for {idigbioURL}")
+        logging.warning(f"Response from api: {idigbioData}")
+        return "Unknown species"
+
     def createAccessionRepo(self, sourceVolume, colorTable, accessionData, sourceSegmentation=None, screenshots=None):
 
         repoName = accessionData['githubRepoName'][1]
-        repoDir = os.path.join(self.localRepositoryDirectory(), repoName)
+        # settings are read here, on the main thread; the background lookups below
+        # get their directories as arguments and must not touch Qt
+        localRepositoryDirectory = self.localRepositoryDirectory()
+        cachesDirectory = os.path.join(localRepositoryDirectory, "MorphoDepotCaches")
+        repoDir = os.path.join(localRepositoryDirectory, repoName)
         os.makedirs(repoDir)
 
-        # save data
-        repoFileNames = []
-        sourceFileName = sourceVolume.GetName()
-        sourceFilePath = os.path.join(repoDir, sourceFileName) + ".nrrd"
-        slicer.util.saveNode(sourceVolume, sourceFilePath, properties={'useCompression': True})
-
-        githubReleaseAssetSizeLimit = 2 * 2**30 - 1 # 2GB - 1
-        if os.path.getsize(sourceFilePath) > githubReleaseAssetSizeLimit:
-            raise ValueError("Volume file is too large, crop or resample so that saved size is less than 2GB")
-
-        # calculate and save checksum
-        checksum = slicer.util.computeChecksum('SHA256', sourceFilePath)
-        checksumFilePath = os.path.join(repoDir, "source_volume_checksum")
-        with open(checksumFilePath, "w") as fp:
-            fp.write(f"SHA256:{checksum}")
-
-        colorTableName = colorTable.GetName()
-        slicer.util.saveNode(colorTable, os.path.join(repoDir, colorTableName) + ".csv")
-        repoFileNames.append(f"{colorTableName}.csv")
-
-        # write accessionData file
-        accessionData['fileFormatVersion'] = MorphoDepotLogic.accessionFileFormatVersion
-        fp = open(os.path.join(repoDir, "MorphoDepotAccession.json"), "w")
-        fp.write(json.dumps(accessionData, indent=4))
-        fp.close()
-
-        # write license file
         if accessionData["license"][1].startswith("CC BY-NC"):
             licenseURL = "https://creativecommons.org/licenses/by-nc/4.0/legalcode.txt"
         else:
             licenseURL = "https://creativecommons.org/licenses/by/4.0/legalcode.txt"
-        response = requests.get(licenseURL)
-        fp = open(os.path.join(repoDir, "LICENSE.txt"), "w")
-        fp.write(response.content.decode('ascii', errors="ignore"))
-        fp.close()
-
-        if accessionData['iDigBioAccessioned'][1] == "Yes":
-            idigbioURL = accessionData['iDigBioURL'][1]
-            specimenID = idigbioURL.split("/")[-1]
-            import idigbio
-            api = idigbio.json()
-            idigbioData = api.view("records", specimenID)
-            if 'ala:species' in idigbioData['data']:
-                speciesString = idigbioData['data']['ala:species']
-            elif 'dwc:scientificName' in idigbioData['data']:
-                speciesString = idigbioData['data']['dwc:scientificName']
-            else:
-                logging.warning(f"Could not find species for {idigbioURL}")
-                logging.warning(f"Response from api: {idigbioData}")
-                speciesString = "Unknown species"
-        else:
-            speciesString = accessionData['species'][1]
+
+        # network lookups run in the background while the volume is saved on the main thread
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            licensePathFuture = executor.submit(self.cachedLicensePath, licenseURL, os.path.join(cachesDirectory, "Licenses"))
+            speciesFuture = executor.submit(self.accessionSpecies, accessionData, os.path.join(cachesDirectory, "iDigBio"))
+
+            # save data
+            repoFileNames = []
+            sourceFileName = sourceVolume.GetName()
+            sourceFilePath = os.path.join(repoDir, sourceFileName) + ".nrrd"
+            slicer.util.saveNode(sourceVolume, sourceFilePath, properties={'useCompression': True})
+
+            githubReleaseAssetSizeLimit = 2 * 2**30 - 1 # 2GB - 1
+            if os.path.getsize(sourceFilePath) > githubReleaseAssetSizeLimit:
+                raise ValueError("Volume file is too large, crop or resample so that saved size is less than 2GB")
+
+            # calculate and save checksum
+            checksum = slicer.util.computeChecksum('SHA256', sourceFilePath)
+            checksumFilePath = os.path.join(repoDir, "source_volume_checksum")
+            with open(checksumFilePath, "w") as fp:
+                fp.write(f"SHA256:{checksum}")
+
+            # write source volume pointer file (owner-agnostic relative path for transfer safety)
+            with open(os.path.join(repoDir, "source_volume"), "w") as fp:
+                fp.write(f"releases/download/v1/{sourceFileName}.nrrd")
+
+            colorTableName = colorTable.GetName()
+            slicer.util.saveNode(colorTable, os.path.join(repoDir, colorTableName) + ".csv")
+            repoFileNames.append(f"{colorTableName}.csv")
+
+            # write accessionData file
+            accessionData['fileFormatVersion'] = MorphoDepotLogic.accessionFileFormatVersion
+            with open(os.path.join(repoDir, "MorphoDepotAccession.json"), "w") as fp:
+                json.dump(accessionData, fp, indent=4)
+
+            # write license file
+            shutil.copyfile(licensePathFuture.result(), os.path.join(repoDir, "LICENSE.txt"))
+
+            speciesString = speciesFuture.result()
         speciesTopicString = speciesString.lower().replace(" ", "-")
 
         # write readme file
@@ -3213,9 +3823,8 @@ Repository for segmentation of a specimen scan.  See [this JSON file](MorphoDepo
                 readme_content += f"\n![{caption or screenshot_filename}](screenshots/{screenshot_filename})\n"
                 if caption:
                     readme_content += f"_{caption}_\n"
-        fp = open(os.path.join(repoDir, "README.md"), "w")
-        fp.write(readme_content)
-        fp.close()
+        with open(os.path.join(repoDir, "README.md"), "w") as fp:
+            fp.write(readme_content)
 
         # create initial repo
         repo = git.Repo.init(repoDir, initial_branch='main')
@@ -3224,6 +3833,7 @@ Repository for segmentation of a specimen scan.  See [this JSON file](MorphoDepo
             "README.md",
             "LICENSE.txt",
             "MorphoDepotAccession.json",
+            "source_volume",
             "source_volume_checksum",
         ]
         if sourceSegmentation:
@@ -3248,11 +3858,11 @@ Repository for segmentation of a specimen scan.  See [this JSON file](MorphoDepo
                 json.dump(captions, f, indent=2)
             repoFileNames.append(os.path.join("screenshots", "captions.json"))
         repoFilePaths = [os.path.join(repoDir, fileName) for fileName in repoFileNames]
-        repo.index.add(repoFilePaths)
-        repo.index.commit("Initial commit")
+        repo.git.add("--", *repoFilePaths)
+        repo.git.commit("-m", "Initial commit")
 
         try:
-            self.gh(f"repo create {repoName} --add-readme --disable-wiki --public --source {repoDir} --push")
+            self.gh(["repo", "create", repoName, "--add-readme", "--disable-wiki", "--public", "--source", repoDir, "--push"])
         except RuntimeError as e:
             # gh repo create --push can race with GitHub provisioning the new repo for
             # git-over-HTTPS access; the create succeeds but the immediate push fails with
@@ -3277,30 +3887,30 @@ Repository for segmentation of a specimen scan.  See [this JSON file](MorphoDepo
         self.localRepo = repo
         repoNameWithOwner = self.nameWithOwner("origin")
 
-        self.gh(f"repo edit {repoNameWithOwner} --enable-projects=false --enable-discussions=false")
-
-        self.gh(f"repo edit {repoNameWithOwner} --add-topic morphodepot --add-topic md-{speciesTopicString}")
-
-        # subscribe to all notifications for the new repository
-        # gh repo watch was removed in newer gh CLI versions; use the API directly
-        owner, repoName = repoNameWithOwner.split("/", 1)
-        self.gh(f"api --method PUT /repos/{owner}/{repoName}/subscription --field subscribed=true --field ignored=false")
-
-        # create initial release and add asset
-        # use list for command to handle spaces in notes
-        commandList = ["release", "create", "--repo", repoNameWithOwner, "v1"]
-        commandList += ["--notes", "Initial release"]
-        self.gh(commandList)
-        self.gh(f"release upload --repo {repoNameWithOwner} v1 {sourceFilePath}#{sourceFileName}.nrrd")
-
-        # write source volume pointer file (owner-agnostic relative path for transfer safety)
-        fp = open(os.path.join(repoDir, "source_volume"), "w")
-        fp.write(f"releases/download/v1/{sourceFileName}.nrrd")
-        fp.close()
-
-        repo.index.add([f"{repoDir}/source_volume"])
-        repo.index.commit("Add source file url file")
-        repo.remote(name="origin").push()
+        # create initial release and start uploading the source volume asset
+        self.ghAPI("POST", f"repos/{repoNameWithOwner}/releases",
+                   {"tag_name": "v1", "name": "v1", "body": "Initial release"})
+        # the upload can take minutes for large scans, so the remaining setup runs while it streams
+        uploadCommandList = ["release", "upload", "--repo", repoNameWithOwner, "v1", f"{sourceFilePath}#{sourceFileName}.nrrd"]
+        self.progressMethod(" ".join(uploadCommandList))
+        uploadProcess = self.launchGhProcess([self.ghExecutablePath] + uploadCommandList)
+
+        # settings, topics (the new repository has none to keep) and a subscription
+        # to all notifications for the new repository
+        self.ghAPI("PATCH", f"repos/{repoNameWithOwner}",
+                   {"has_projects": False, "has_discussions": False})
+        self.ghAPI("PUT", f"repos/{repoNameWithOwner}/topics",
+                   {"names": ["morphodepot", f"md-{speciesTopicString}"]})
+        self.ghAPI("PUT", f"repos/{repoNameWithOwner}/subscription",
+                   {"subscribed": True, "ignored": False})
+
+        uploadResult = self.communicateWhileProcessingEvents(uploadProcess)
+        if uploadProcess.returncode != 0:
+            error_message = f"gh command failed: {' '.join(uploadCommandList)}\nOutput: {uploadResult}"
+            logging.error(error_message)
+            self.progressMethod(f"gh command error: {uploadResult}")
+            raise RuntimeError(error_message)
+        self.progressMethod(f"gh command finished: {uploadResult}")
 
         self.ghTopicClearCache()
 
@@ -3316,13 +3926,14 @@ Repository for segmentation of a specimen scan.  See [this JSON file](MorphoDepo
         os.makedirs(searchDirectory, exist_ok=True)
 
         self.repoDataByNameWithOwner = {}
+        self.searchTextByNameWithOwner = {}
 
         for repo in repos:
             try:
                 repoName = repo['name']
                 ownerLogin = repo['owner']['login']
                 nameWithOwner = f"{repoName}^{ownerLogin}"
-                filePath = f"{searchDirectory}/{nameWithOwner}-repoData.json"
+                filePath = os.path.join(searchDirectory, f"{nameWithOwner}-repoData.json")
 
                 self.progressMethod(f"Refreshing {nameWithOwner}")
 
@@ -3371,8 +3982,14 @@ Repository for segmentation of a specimen scan.  See [this JSON file](MorphoDepo
                             self.progressMethod(f"Volume size {repoData['volumeSize']}")
 
                     self.repoDataByNameWithOwner[nameWithOwner] = repoData
+                    # lowercase the free text fields once here instead of on every search
+                    searchText = {"nameWithOwner": nameWithOwner.lower()}
+                    for textField in ["githubRepoName", "species", "otherSubjectDescription"]:
+                        if textField in repoData:
+                            searchText[textField] = repoData[textField][1].lower()
+                    self.searchTextByNameWithOwner[nameWithOwner] = searchText
                     with open(filePath, "w") as fp:
-                        fp.write(json.dumps(repoData))
+                        json.dump(repoData, fp)
 
             except Exception as e:
                 # Use a more specific name here since repo is a dict
@@ -3386,49 +4003,56 @@ Repository for segmentation of a specimen scan.  See [this JSON file](MorphoDepo
         if self.repoDataByNameWithOwner == {}:
             return {}
 
+        # selected options per question as sets for constant time membership tests
+        criteriaSets = {}
+        for question, value in criteria.items():
+            if question != "freeText":
+                criteriaSets[question] = set(value) if isinstance(value, (list, set, tuple)) else {value}
+
         excludedRepos = set()
         for nameWithOwner, repoData in self.repoDataByNameWithOwner.items():
-            for question in criteria:
+            for question, criterion in criteriaSets.items():
                 # Handle repoType with default assumption
                 if question == "repoType":
                     repoValue = repoData.get("repoType", (None, "Archival (intended for long-term maintenance)"))[1]
-                    if repoValue not in criteria["repoType"]:
+                    if repoValue not in criterion:
                         excludedRepos.add(nameWithOwner)
                     continue
 
                 if question == "subjectType":
                     # if subjectType is not present, assume "Biological specimen"
                     repoValue = repoData.get("subjectType", (None, "Biological specimen"))[1]
-                    if repoValue not in criteria["subjectType"]:
+                    if repoValue not in criterion:
                         excludedRepos.add(nameWithOwner)
                     continue
 
                 # Handle other criteria
                 if question in repoData:
                     repoValue = repoData[question][1]
-                    if repoValue.__class__() == []:
-                        valueInCriterion = False
-                        for value in repoValue:
-                            if value in criteria[question]:
-                                valueInCriterion = True
-                            if not valueInCriterion:
-                                excludedRepos.add(nameWithOwner)
+                    if isinstance(repoValue, list):
+                        # keep the repo if any of its values is among the selected options
+                        if not any(value in criterion for value in repoValue):
+                            excludedRepos.add(nameWithOwner)
                     else:
-                        if repoValue != "" and repoValue not in criteria[question]:
+                        if repoValue != "" and repoValue not in criterion:
                             excludedRepos.add(nameWithOwner)
 
-        matchString = f"*{criteria['freeText'].lower()}*"
+        freeText = criteria['freeText'].lower()
+        # plain text is a substring test; only fall back to fnmatch if wildcards were typed
+        useWildcards = any(character in freeText for character in "*?[")
+        matchString = f"*{freeText}*"
         matchingRepos = set()
-        textFields = ["githubRepoName", "species"]
-        if "Other" in criteria.get("subjectType", []):
+        textFields = ["nameWithOwner", "githubRepoName", "species"]
+        if "Other" in criteriaSets.get("subjectType", set()):
             textFields.append("otherSubjectDescription")
-        for nameWithOwner, repoData in self.repoDataByNameWithOwner.items():
-            if fnmatch.fnmatch(nameWithOwner, matchString):
-                matchingRepos.add(nameWithOwner)
+        for nameWithOwner, searchText in self.searchTextByNameWithOwner.items():
             for textField in textFields:
-                if textField in repoData:
-                    if fnmatch.fnmatch(repoData[textField][1].lower(), matchString):
-                        matchingRepos.add(nameWithOwner)
+                text = searchText.get(textField)
+                if text is None:
+                    continue
+                if fnmatch.fnmatch(text, matchString) if useWildcards else freeText in text:
+                    matchingRepos.add(nameWithOwner)
+                    break
 
         results = {}
         for nameWithOwner in matchingRepos:
@@ -3644,7 +4268,9 @@ class MorphoDepotTest(ScriptedLoadableModuleTest):
         # 2. Switch to Creator auth
         switchUser(creator)
         self.delayDisplay("Creating a test repository")
-        widget.tabWidget.setCurrentWidget(widget.createUI.createRepository.parent().parent())
+        widget.tabWidget.setCurrentIndex(widget.createTabIndex)
+        # the annotate tab is driven below without being shown
+        widget.ensureTabBuilt(widget.annotateTabIndex)
 
         # Use sample data for volume and color table
         import SampleData
@@ -3766,17 +4392,24 @@ class MorphoDepotTest(ScriptedLoadableModuleTest):
             widget.onCommit()
             slicer.app.processEvents()
 
-            # 11. Mark PR as ready. widget.onRequestReview -> requestReview -> issuePR ->
-            # prList -> search index, which lags for the freshly created PR (silent failure
-            # would leave the PR in draft and break the later merge). Find the PR via direct
-            # REST and use gh directly.
+        # 11. Mark PRs as ready. widget.onRequestReview only handles the loaded issue, so
+        # find the PRs of both issues with one query and use gh directly. The ready calls
+        # are independent of each other and of the scene, so they run concurrently; they
+        # call gh without logic.gh because its progress reporting touches the GUI, which
+        # is only allowed on the main thread.
+        rawPRs = logic.ghJSON(f"pr list --repo {repoNameWithOwner} --state open --json number,title")
+        readyCommands = []
+        for issue in annotatorIssues:
             self.delayDisplay(f"Requesting review for work on issue #{issue['number']}")
             branchName = f"issue-{issue['number']}"
-            rawPRs = logic.ghJSON(f"pr list --repo {repoNameWithOwner} --state open --json number,title")
             matching = [p for p in rawPRs if p['title'] == branchName]
             self.assertEqual(len(matching), 1, f"Expected 1 open PR for branch {branchName}; found {len(matching)}.")
-            logic.gh(["pr", "ready", str(matching[0]['number']), "--repo", repoNameWithOwner])
-            slicer.app.processEvents()
+            readyCommands.append([logic.ghExecutablePath, "pr", "ready", str(matching[0]['number']), "--repo", repoNameWithOwner])
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            readyResults = list(executor.map(lambda command: subprocess.run(command, capture_output=True, text=True), readyCommands))
+        for command, result in zip(readyCommands, readyResults):
+            self.assertEqual(result.returncode, 0, f"gh {' '.join(command[1:])} failed: {result.stderr}")
+        slicer.app.processEvents()
 
         # 12. Switch to Creator to review the PRs
         switchUser(creator)
@@ -3808,10 +4441,8 @@ class MorphoDepotTest(ScriptedLoadableModuleTest):
         prToRequestChanges = repoPRsByIssueID[issueIDs[1]]
         issueToChange = issuesByID[issueIDs[1]]
 
-        # Approve the first PR. logic.approvePR() and logic.requestChanges() resolve the PR
-        # via logic.issuePR() -> logic.prList() -> ghTopicData() -> the topic search index, which
-        # lags for freshly created PRs. We have the PR numbers from the REST query above, so
-        # invoke gh directly to avoid the indexing dependency.
+        # Approve the first PR. We have the PR numbers from the REST query above, so
+        # invoke gh directly rather than resolving them again via logic.issuePR().
         self.delayDisplay(f"Approving and merging PR #{prToApprove['number']}")
         logic.loadPR(prToApprove, repoDirectory)
         approveNum = str(prToApprove['number'])
@@ -3819,7 +4450,7 @@ class MorphoDepotTest(ScriptedLoadableModuleTest):
         logic.gh(["pr", "merge", approveNum, "--repo", repoNameWithOwner, "--squash", "--body", "Merging and closing"])
         slicer.app.processEvents()
 
-        # Request changes on the second PR (also direct-gh for the same reason).
+        # Request changes on the second PR, also with the known PR number.
         self.delayDisplay(f"Requesting changes on PR #{prToRequestChanges['number']}")
         logic.loadPR(prToRequestChanges, repoDirectory)
         changeNum = str(prToRequestChanges['number'])
@@ -3839,24 +4470,17 @@ class MorphoDepotTest(ScriptedLoadableModuleTest):
         segmentation = logic.segmentationNode.GetSegmentation()
         segmentation.AddEmptySegment("additional-annotator-segment")
 
-        # Replace widget.onCommit -> commitAndPush. After pushing, commitAndPush calls
-        # issuePR (search-index dependent) to check whether to create a PR; on lag it
-        # returns None and attempts to create a duplicate. Replicate the save+commit+push
-        # directly. The PR already exists, so no creation step is needed.
+        # Commit and push; the PR lookup in commitAndPush filters by branch on github,
+        # so it finds the existing PR and does not create another one.
         self.delayDisplay(f"Committing additional change on issue #{issueToChange['number']}")
-        ok = slicer.util.saveNode(logic.segmentationNode, logic.segmentationPath, properties={'useCompression': True})
-        self.assertTrue(ok, "Segmentation save failed")
-        logic.localRepo.index.add([logic.segmentationPath])
-        logic.localRepo.index.commit(f"Addressing feedback on issue #{issueToChange['number']}")
-        branchName = logic.localRepo.active_branch.name
-        logic.localRepo.git.pull("--rebase", "origin", branchName)
-        logic.localRepo.remote(name="origin").push(branchName)
+        ok = logic.commitAndPush(f"Addressing feedback on issue #{issueToChange['number']}")
+        self.assertTrue(ok, "Commit and push failed")
         slicer.app.processEvents()
         # Mark PR ready (it was set back to draft by the request-changes step above).
         logic.gh(["pr", "ready", changeNum, "--repo", repoNameWithOwner])
         slicer.app.processEvents()
 
-        # 14. Switch back to Creator to approve the updated PR (direct gh, same reason).
+        # 14. Switch back to Creator to approve the updated PR (direct gh, as in step 12).
         switchUser(creator)
         self.delayDisplay(f"Creator approving updated PR #{prToRequestChanges['number']}")
         logic.loadPR(prToRequestChanges, repoDirectory)
@@ -3934,7 +4558,7 @@ class MorphoDepotTest(ScriptedLoadableModuleTest):
         try:
             # 15. Create a release and open the repository page
             self.delayDisplay("Creating a new release")
-            widget.tabWidget.setCurrentWidget(widget.releaseUI.repoList.parent().parent())
+            widget.tabWidget.setCurrentIndex(widget.releaseTabIndex)
             widget.onRefreshReleaseTab()
             slicer.app.processEvents()
 
@@ -3942,7 +4566,7 @@ class MorphoDepotTest(ScriptedLoadableModuleTest):
             repoItem = None
             for i in range(widget.releaseUI.repoList.count):
                 item = widget.releaseUI.repoList.item(i)
-                repo = widget.reposByItem[item]
+                repo = widget.releaseRepos[i]
                 if repo['nameWithOwner'] == repoNameWithOwner:
                     repoItem = item
                     break